@@ -38,19 +38,6 @@ else:
 echo -e "${YELLOW}Collecting static files...${NC}"
 python manage.py collectstatic --noinput
 
-# Start Gunicorn with production settings
-echo -e "${GREEN}Starting Gunicorn server...${NC}"
-exec gunicorn \
-    --bind 0.0.0.0:8000 \
-    --workers 4 \
-    --worker-class sync \
-    --worker-connections 1000 \
-    --max-requests 1000 \
-    --max-requests-jitter 100 \
-    --timeout 30 \
-    --keep-alive 2 \
-    --log-level info \
-    --access-logfile /app/logs/gunicorn-access.log \
-    --error-logfile /app/logs/gunicorn-error.log \
-    --capture-output \
-    principal360_survey.wsgi:application
\ No newline at end of file
+# Start Gunicorn; GUNICORN_PROFILE (sync, gthread or uvicorn) and worker sizing are read by gunicorn.conf.py
+echo -e "${GREEN}Starting Gunicorn server (${GUNICORN_PROFILE:-gthread} profile)...${NC}"
+exec gunicorn --config /app/gunicorn.conf.py
@@ -0,0 +1,59 @@
+"""
+Gunicorn configuration. GUNICORN_PROFILE selects the worker model:
+
+- sync:    one request per process; workers = 2 * CPUs + 1
+- gthread: GUNICORN_THREADS (default 4) requests per process, so a slow SMTP send or
+           report render ties up a thread instead of a whole worker; workers = CPUs + 1
+- uvicorn: ASGI workers serving principal360_survey.asgi; workers = CPUs + 1
+
+CPUs are the ones this process may run on (its affinity mask, e.g. a container's
+cpuset), not every CPU on the host. The derived worker count is capped at
+GUNICORN_MAX_WORKERS (default 12), since past that extra workers mostly add
+database connections rather than throughput; GUNICORN_WORKERS sets the count
+directly and is not capped. Every thread keeps its own database connection, so
+workers * threads must stay below the PostgreSQL (or PgBouncer) connection limit.
+"""
+
+import multiprocessing
+import os
+
+profile = os.environ.get('GUNICORN_PROFILE', 'gthread')
+try:
+    cpus = len(os.sched_getaffinity(0))
+except AttributeError:
+    # sched_getaffinity is Linux-only
+    cpus = multiprocessing.cpu_count()
+max_workers = int(os.environ.get('GUNICORN_MAX_WORKERS', '12'))
+
+if profile == 'sync':
+    worker_class = 'sync'
+    default_workers = 2 * cpus + 1
+    threads = 1
+elif profile == 'gthread':
+    worker_class = 'gthread'
+    default_workers = cpus + 1
+    threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+elif profile == 'uvicorn':
+    worker_class = 'uvicorn.workers.UvicornWorker'
+    default_workers = cpus + 1
+    threads = 1
+    wsgi_app = 'principal360_survey.asgi:application'
+    # Persistent connections are not reused across ASGI requests, so don't leave them open
+    os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+else:
+    raise RuntimeError(f'Unknown GUNICORN_PROFILE {profile!r}; use sync, gthread or uvicorn')
+
+if profile != 'uvicorn':
+    wsgi_app = 'principal360_survey.wsgi:application'
+
+workers = int(os.environ.get('GUNICORN_WORKERS', min(default_workers, max_workers)))
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+max_requests = 1000
+max_requests_jitter = 100
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+keepalive = 2
+
+loglevel = 'info'
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '/app/logs/gunicorn-access.log') or None
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '/app/logs/gunicorn-error.log')
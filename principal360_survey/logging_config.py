@@ -0,0 +1,113 @@
+"""Non-blocking logging: records are queued by the caller and written by a background thread.
+
+settings.LOGGING points the root logger at a single QueueListenerHandler. The
+handler only puts records on a bounded in-memory queue (dropping them if the
+queue is full), and a QueueListener thread formats and writes them to the
+console and, optionally, a size-rotated file. Request threads never touch a
+stream or the disk.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import traceback
+from datetime import datetime, timezone
+
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any ``extra=`` fields of the record."""
+
+    def format(self, record):
+        payload = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exception'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = record.stack_info
+        return json.dumps(payload, default=str)
+
+
+class QueueListenerHandler(logging.handlers.QueueHandler):
+    """QueueHandler that owns the QueueListener and the handlers doing the actual I/O.
+
+    The formatter configured for this handler is applied to the output
+    handlers; the listener is restarted after a fork so that each gunicorn
+    worker has its own writer thread.
+    """
+
+    def __init__(self, filename='', max_bytes=10 * 1024 * 1024, backup_count=5, queue_size=10000):
+        super().__init__(None)
+        self.queue_size = queue_size
+        self.dropped = 0
+        self.output_handlers = [logging.StreamHandler(sys.stderr)]
+        if filename:
+            self.output_handlers.append(logging.handlers.RotatingFileHandler(
+                filename, maxBytes=max_bytes, backupCount=backup_count, delay=True, encoding='utf-8',
+            ))
+        self.listener = None
+        self.start_listener()
+        atexit.register(self.stop_listener)
+
+    def start_listener(self):
+        # A fresh queue per process: one inherited across a fork may hold the parent's records
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.listener = logging.handlers.QueueListener(
+            self.queue, *self.output_handlers, respect_handler_level=True
+        )
+        self.listener.start()
+        self.pid = os.getpid()
+
+    def stop_listener(self):
+        if self.listener is not None and self.pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+
+    def setFormatter(self, fmt):
+        for handler in self.output_handlers:
+            handler.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Resolve the message and traceback now (the arguments may change before the listener
+        # runs), but leave formatting to the output handlers so extra fields survive
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = ''.join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if self.pid != os.getpid():
+            # The listener thread did not survive a fork (e.g. gunicorn --preload)
+            self.start_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        self.stop_listener()
+        for handler in self.output_handlers:
+            handler.close()
+        super().close()
@@ -0,0 +1,223 @@
+"""Project middleware and the request timing it relies on.
+
+RequestTimingMiddleware measures every request and reports the numbers as a
+Server-Timing header (if REQUEST_TIMING_HEADER is set) and, for a sampled
+fraction of requests (plus every slow one), a structured log line. Full request dumps are opt-in: they need the
+X-Debug-Dump header carrying REQUEST_DUMP_TOKEN, or a REQUEST_DUMP_SAMPLE_RATE
+hit. Template render time comes from the TimedDjangoTemplates backend.
+AsyncWhiteNoiseMiddleware serves static files without leaving the event loop
+for other requests.
+"""
+
+import contextvars
+import logging
+import random
+import secrets
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+logger = logging.getLogger('request_timing')
+
+DUMP_HEADER = 'X-Debug-Dump'
+REDACTED_HEADERS = {'authorization', 'cookie', 'x-csrftoken', DUMP_HEADER.lower()}
+
+_current_timing = contextvars.ContextVar('request_timing', default=None)
+
+
+class RequestTiming:
+    """Counters collected while a single request is processed."""
+
+    def __init__(self, record_sql=False):
+        self.start = 0.0
+        self.db_time = 0.0
+        self.db_queries = 0
+        self.template_time = 0.0
+        self.record_sql = record_sql
+        self.sql = []
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper on every connection; charges each query to the current request's timing.
+
+    The timing is looked up in a context variable rather than bound to the
+    connection, because under ASGI queries from concurrent requests share the
+    thread (and connection) that runs sync_to_async code.
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.db_time += time.perf_counter() - start
+        timing.db_queries += 1
+        if timing.record_sql:
+            timing.sql.append(sql)
+
+
+def install_query_timing(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+connection_created.connect(install_query_timing)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timing = _current_timing.get()
+            if timing is not None:
+                timing.template_time += time.perf_counter() - start
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates backend that adds top-level render time to the current request's timing."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
+
+
+class RequestTimingMiddleware:
+    """Time each request and report it via Server-Timing and sampled log lines."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.server_timing = getattr(settings, 'REQUEST_TIMING_HEADER', settings.DEBUG)
+        self.log_sample_rate = getattr(settings, 'REQUEST_TIMING_LOG_SAMPLE_RATE', 0.0)
+        self.slow_request_ms = getattr(settings, 'REQUEST_TIMING_SLOW_MS', 1000)
+        self.dump_sample_rate = getattr(settings, 'REQUEST_DUMP_SAMPLE_RATE', 0.0)
+        self.dump_token = getattr(settings, 'REQUEST_DUMP_TOKEN', '')
+        self.static_url = settings.STATIC_URL or '/static/'
+        if not self.static_url.startswith('/'):
+            self.static_url = '/' + self.static_url
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if request.path.startswith(self.static_url):
+            return self.get_response(request)
+
+        # Covers connections opened before this module was imported, e.g. by the test runner
+        for connection in connections.all():
+            install_query_timing(connection)
+        timing, token = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timing.reset(token)
+        return self.finish(request, response, timing)
+
+    async def __acall__(self, request):
+        if request.path.startswith(self.static_url):
+            return await self.get_response(request)
+
+        timing, token = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timing.reset(token)
+        return self.finish(request, response, timing)
+
+    def start(self, request):
+        timing = RequestTiming(record_sql=self.should_dump(request))
+        timing.start = time.perf_counter()
+        return timing, _current_timing.set(timing)
+
+    def finish(self, request, response, timing):
+        total_ms = (time.perf_counter() - timing.start) * 1000
+
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'app;dur={total_ms:.1f}',
+                f'db;dur={timing.db_time * 1000:.1f};desc="{timing.db_queries} queries"',
+                f'tpl;dur={timing.template_time * 1000:.1f}',
+            ])
+
+        if total_ms >= self.slow_request_ms or random.random() < self.log_sample_rate:
+            logger.info(
+                '%s %s %s %.1fms db=%.1fms/%d tpl=%.1fms',
+                request.method, request.path, response.status_code, total_ms,
+                timing.db_time * 1000, timing.db_queries, timing.template_time * 1000,
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'status': response.status_code,
+                    'duration_ms': round(total_ms, 1),
+                    'db_ms': round(timing.db_time * 1000, 1),
+                    'db_queries': timing.db_queries,
+                    'template_ms': round(timing.template_time * 1000, 1),
+                },
+            )
+
+        if timing.record_sql:
+            self.dump(request, response, timing)
+        return response
+
+    def should_dump(self, request):
+        requested = request.headers.get(DUMP_HEADER)
+        if requested is not None:
+            # Without a configured token, dumps can only be requested in DEBUG
+            return secrets.compare_digest(requested, self.dump_token) if self.dump_token else settings.DEBUG
+        return self.dump_sample_rate > 0 and random.random() < self.dump_sample_rate
+
+    def dump(self, request, response, timing):
+        headers = {
+            name: '<redacted>' if name.lower() in REDACTED_HEADERS else value
+            for name, value in request.headers.items()
+        }
+        logger.info(
+            'REQUEST DUMP %s %s -> %s\nheaders: %s\nresponse headers: %s\nqueries:\n%s',
+            request.method, request.get_full_path(), response.status_code,
+            headers, dict(response.headers), '\n'.join(timing.sql),
+        )
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise that can also run on the event loop.
+
+    WhiteNoise's middleware is sync-only, and under ASGI Django would run every
+    request through the single sync thread to call it. This version serves static
+    files through sync_to_async and hands everything else straight to the next
+    async handler.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
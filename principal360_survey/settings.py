@@ -38,9 +38,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
-    'debug_middleware.DebugMiddleware',
+    'principal360_survey.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'principal360_survey.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -53,7 +53,8 @@ ROOT_URLCONF = 'principal360_survey.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates plus render timing for the Server-Timing header
+        'BACKEND': 'principal360_survey.middleware.TimedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -81,6 +82,14 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Keep each worker's connection open between requests (seconds; 0 closes it after
+        # every request) and check that it is still alive before reusing it
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        # Pooling across workers is PgBouncer's job: set DB_PGBOUNCER=True when DB_HOST points at
+        # it in transaction pooling mode, where a server-side cursor can end up on a different
+        # server connection than the one that declared it
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_PGBOUNCER', 'False') == 'True',
     }
 } if not DEBUG else {
     'default': {
@@ -90,6 +99,20 @@ DATABASES = {
 }
 
 
+# Cache
+# Use a shared backend (e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# with CACHE_LOCATION=redis://...) so invalidations reach every gunicorn worker.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'survey360'),
+    }
+}
+
+# Upper bound on how stale cached dashboard totals may get (seconds)
+DASHBOARD_STATS_TIMEOUT = int(os.environ.get('DASHBOARD_STATS_TIMEOUT', '60'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -141,6 +164,10 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# The Answer indexes use INCLUDE columns, which only PostgreSQL supports; on the SQLite
+# development database Django builds them as plain indexes and would warn on every run
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
 # Email settings
 EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
@@ -153,6 +180,25 @@ DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@principal360.
 # Domain for email links
 DEFAULT_DOMAIN = os.environ.get('DEFAULT_DOMAIN', 'http://localhost:8005')
 
+# Report statistics backend: 'aggregates' (running totals), 'numpy', 'answers' or 'python'.
+# 'numpy' is optional: numpy is not in requirements.txt and must be installed separately.
+REPORT_STATS_BACKEND = os.environ.get('REPORT_STATS_BACKEND', 'aggregates')
+
+# Request timing: Server-Timing header on every response (by default only in DEBUG, as
+# it shows clients the app's DB and template timings), a log line for a sampled
+# fraction of requests (and every slow one). Full request dumps need the X-Debug-Dump
+# header with REQUEST_DUMP_TOKEN (any value in DEBUG when no token is set).
+REQUEST_TIMING_HEADER = os.environ.get('REQUEST_TIMING_HEADER', str(DEBUG)) == 'True'
+REQUEST_TIMING_LOG_SAMPLE_RATE = float(os.environ.get('REQUEST_TIMING_LOG_SAMPLE_RATE', '0.05'))
+REQUEST_TIMING_SLOW_MS = float(os.environ.get('REQUEST_TIMING_SLOW_MS', '1000'))
+REQUEST_DUMP_SAMPLE_RATE = float(os.environ.get('REQUEST_DUMP_SAMPLE_RATE', '0'))
+REQUEST_DUMP_TOKEN = os.environ.get('REQUEST_DUMP_TOKEN', '')
+
+# Optionally also store each answer as a long-format Answer row (54 extra rows per submission)
+# for analytics and the 'answers' stats backend. After turning it on, run
+# manage.py backfill_answers to create the rows for responses submitted while it was off.
+RECORD_LONG_FORMAT_ANSWERS = os.environ.get('RECORD_LONG_FORMAT_ANSWERS', 'False') == 'True'
+
 # Security settings - ALL SSL/HTTPS DISABLED FOR HTTP ONLY
 SESSION_COOKIE_SECURE = False
 CSRF_COOKIE_SECURE = False
@@ -166,60 +212,78 @@ CSRF_COOKIE_HTTPONLY = True
 X_FRAME_OPTIONS = 'DENY'
 
 # Session settings
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
-SESSION_COOKIE_AGE = 3600  # 1 hour
+# 'cached_db' reads sessions from the cache and only writes the database when a session
+# changes; 'signed_cookies' keeps them client-side (no server-side invalidation on logout).
+# 'cached_db' is only the default with a cache shared by all workers: with a per-process
+# cache, a session logged out in one worker would stay valid in the others' caches.
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+PER_PROCESS_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+SESSION_ENGINE = SESSION_BACKENDS[os.environ.get(
+    'SESSION_BACKEND', 'db' if CACHES['default']['BACKEND'] in PER_PROCESS_CACHES else 'cached_db'
+)]
+SESSION_COOKIE_AGE = int(os.environ.get('SESSION_COOKIE_AGE', '3600'))  # 1 hour
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
-SESSION_SAVE_EVERY_REQUEST = True
+# Saving on every request refreshes the expiry but writes the session store on every page view
+SESSION_SAVE_EVERY_REQUEST = os.environ.get('SESSION_SAVE_EVERY_REQUEST', 'False') == 'True'
+
+# Flash messages live in a signed cookie, so anonymous survey traffic never creates a session
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
 
 # Login settings
 LOGIN_URL = '/admin/'
 LOGIN_REDIRECT_URL = '/admin/dashboard/'
 LOGOUT_REDIRECT_URL = '/admin/'
 
-# COMPREHENSIVE LOGGING - DEBUG EVERYTHING
+# Logging: every logger ends at one queue handler; a background thread writes the records
+# to stderr and, when LOG_FILE is set, a rotating file. LOG_FORMAT is 'json' or 'text'.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'DEBUG' if DEBUG else 'INFO')
+DJANGO_LOG_LEVEL = os.environ.get('DJANGO_LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text' if DEBUG else 'json')
+LOG_FILE = os.environ.get('LOG_FILE', '')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+        'text': {
+            'format': '{levelname} {asctime} {name} {process:d} {message}',
             'style': '{',
         },
-        'simple': {
-            'format': '{levelname} {message}',
-            'style': '{',
+        'json': {
+            '()': 'principal360_survey.logging_config.JsonFormatter',
         },
     },
     'handlers': {
-        'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose'
-        },
-        'file': {
-            'class': 'logging.FileHandler',
-            'filename': '/app/logs/debug.log',
-            'formatter': 'verbose'
+        'queue': {
+            'class': 'principal360_survey.logging_config.QueueListenerHandler',
+            'formatter': LOG_FORMAT,
+            'filename': LOG_FILE,
+            'max_bytes': int(os.environ.get('LOG_MAX_BYTES', str(10 * 1024 * 1024))),
+            'backup_count': int(os.environ.get('LOG_BACKUP_COUNT', '5')),
+            'queue_size': int(os.environ.get('LOG_QUEUE_SIZE', '10000')),
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
-        'level': 'DEBUG',
+        'handlers': ['queue'],
+        'level': LOG_LEVEL,
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
-            'propagate': False,
+            'level': DJANGO_LOG_LEVEL,
         },
-        'django.request': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
-            'propagate': False,
+        'request_timing': {
+            'level': 'INFO',
         },
-        'django.security': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
-            'propagate': False,
+        # Otherwise every async view served under WSGI logs its new event loop in DEBUG
+        'asyncio': {
+            'level': 'WARNING',
         },
     },
-}
\ No newline at end of file
+}
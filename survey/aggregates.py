@@ -0,0 +1,138 @@
+"""Running per-question score aggregates for the survey application."""
+
+from django.db import transaction
+from django.db.models import Case, When, Value, F, Sum, Count, IntegerField, CharField
+
+from .models import Survey, SurveyResponse, QuestionAggregate
+
+
+QUESTION_NUMBERS = range(2, 56)
+
+
+def report_relationship_expression():
+    """SQL expression grouping self-assessments under 'self'."""
+    return Case(
+        When(is_leader_self_assessment=True, then=Value('self')),
+        default=F('relationship'),
+        output_field=CharField(),
+    )
+
+
+def get_report_relationship(response):
+    """Relationship key a response is reported under."""
+    return 'self' if response.is_leader_self_assessment else response.relationship
+
+
+def compute_question_totals(survey):
+    """Scan the survey's responses and return {q_num: {relationship: (sum, count, squares)}}.
+
+    Runs as a single GROUP BY query; used to (re)build the running aggregates.
+    """
+    aggregates = {}
+    for q_num in QUESTION_NUMBERS:
+        field_name = f'q{q_num}_response'
+        # Answers are stored as 1-7 scores; blank answers are NULL and ignored by SUM/COUNT
+        aggregates[f'q{q_num}_sum'] = Sum(field_name)
+        aggregates[f'q{q_num}_squares'] = Sum(F(field_name) * F(field_name))
+        aggregates[f'q{q_num}_count'] = Count(field_name)
+
+    rows = (
+        SurveyResponse.objects.filter(survey=survey)
+        .annotate(report_relationship=report_relationship_expression())
+        .order_by()
+        .values('report_relationship')
+        .annotate(**aggregates)
+    )
+
+    totals = {q_num: {} for q_num in QUESTION_NUMBERS}
+    for row in rows:
+        relationship = row['report_relationship']
+        for q_num in QUESTION_NUMBERS:
+            count = row[f'q{q_num}_count']
+            if count:
+                totals[q_num][relationship] = (row[f'q{q_num}_sum'], count, row[f'q{q_num}_squares'])
+    return totals
+
+
+def load_question_totals(survey):
+    """Return {q_num: {relationship: (sum, count, squares)}} from the running aggregates.
+
+    Reads O(questions x relationships) rows regardless of the number of raters.
+    Surveys whose aggregates were never built (e.g. seeded data) fall back to
+    compute_question_totals; this read path never writes, so run the
+    rebuild_aggregates command to store them.
+    """
+    rows = list(
+        QuestionAggregate.objects.filter(survey=survey)
+        .values_list('question_no', 'relationship', 'score_total', 'response_count', 'score_squares')
+    )
+    if not rows and survey.responses.exists():
+        return compute_question_totals(survey)
+
+    totals = {q_num: {} for q_num in QUESTION_NUMBERS}
+    for q_num, relationship, score_total, response_count, score_squares in rows:
+        if response_count:
+            totals[q_num][relationship] = (score_total, response_count, score_squares)
+    return totals
+
+
+def record_response_aggregates(response):
+    """Fold a newly saved response into its survey's running aggregates.
+
+    Issues two statements (create missing rows, then one F()-based UPDATE) and
+    must run in the same transaction as the response insert.
+    """
+    scores = {}
+    for q_num in QUESTION_NUMBERS:
+        score = getattr(response, f'q{q_num}_response')
+        if score:
+            scores[q_num] = score
+    if not scores:
+        return
+
+    relationship = get_report_relationship(response)
+    QuestionAggregate.objects.bulk_create(
+        [QuestionAggregate(survey_id=response.survey_id, question_no=q_num, relationship=relationship)
+         for q_num in scores],
+        ignore_conflicts=True,
+    )
+    QuestionAggregate.objects.filter(
+        survey_id=response.survey_id,
+        relationship=relationship,
+        question_no__in=list(scores),
+    ).update(
+        response_count=F('response_count') + 1,
+        score_total=F('score_total') + Case(
+            *[When(question_no=q_num, then=Value(score)) for q_num, score in scores.items()],
+            default=Value(0), output_field=IntegerField(),
+        ),
+        score_squares=F('score_squares') + Case(
+            *[When(question_no=q_num, then=Value(score * score)) for q_num, score in scores.items()],
+            default=Value(0), output_field=IntegerField(),
+        ),
+    )
+
+
+def rebuild_question_aggregates(survey):
+    """Recompute a survey's running aggregates from its stored responses and return the totals.
+
+    The survey row is locked first, as submit_survey_response does, so no
+    response can be recorded between computing the totals and storing them.
+    """
+    with transaction.atomic():
+        Survey.objects.select_for_update().only('pk').get(pk=survey.pk)
+        totals = compute_question_totals(survey)
+        QuestionAggregate.objects.filter(survey=survey).delete()
+        QuestionAggregate.objects.bulk_create([
+            QuestionAggregate(
+                survey=survey,
+                question_no=q_num,
+                relationship=relationship,
+                score_total=score_total,
+                response_count=response_count,
+                score_squares=score_squares,
+            )
+            for q_num, by_relationship in totals.items()
+            for relationship, (score_total, response_count, score_squares) in by_relationship.items()
+        ])
+    return totals
@@ -0,0 +1,80 @@
+"""Long-format answer storage and the analytics queries that run on it."""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum, Count
+
+from .models import Survey, SurveyResponse, Answer
+from .aggregates import QUESTION_NUMBERS, get_report_relationship
+
+
+def answers_enabled():
+    """Whether submissions also write the long-format Answer rows."""
+    return getattr(settings, 'RECORD_LONG_FORMAT_ANSWERS', False)
+
+
+def build_answers(response):
+    """Unsaved Answer rows for every non-blank question of a saved response."""
+    relationship = get_report_relationship(response)
+    answers = []
+    for q_num in QUESTION_NUMBERS:
+        score = getattr(response, f'q{q_num}_response')
+        if score:
+            answers.append(Answer(
+                response_id=response.pk,
+                survey_id=response.survey_id,
+                question_no=q_num,
+                relationship=relationship,
+                score=score,
+            ))
+    return answers
+
+
+def record_response_answers(response):
+    """Write a newly saved response's answers in one INSERT (no-op when disabled)."""
+    if answers_enabled():
+        Answer.objects.bulk_create(build_answers(response))
+
+
+def backfill_answers(survey, batch_size=500):
+    """Rebuild a survey's Answer rows from its wide response columns; return the row count.
+
+    Locks the survey row first, as submit_survey_response and
+    rebuild_question_aggregates do, so a submission cannot land between the
+    delete and the re-read and get its answers inserted twice.
+    """
+    responses = (
+        SurveyResponse.objects.filter(survey=survey)
+        .order_by()
+        .only('id', 'survey', 'relationship', 'is_leader_self_assessment',
+              *[f'q{q_num}_response' for q_num in QUESTION_NUMBERS])
+    )
+    created = 0
+    with transaction.atomic():
+        Survey.objects.select_for_update().only('pk').get(pk=survey.pk)
+        Answer.objects.filter(survey=survey).delete()
+        batch = []
+        for response in responses.iterator(chunk_size=batch_size):
+            batch.extend(build_answers(response))
+            if len(batch) >= batch_size:
+                created += len(Answer.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            created += len(Answer.objects.bulk_create(batch))
+    return created
+
+
+def answer_question_totals(survey):
+    """Return {q_num: {relationship: (sum, count, squares)}} with one GROUP BY over Answer rows."""
+    rows = (
+        Answer.objects.filter(survey=survey)
+        .order_by()
+        .values('question_no', 'relationship')
+        .annotate(score_total=Sum('score'), response_count=Count('id'), score_squares=Sum(F('score') * F('score')))
+    )
+    totals = {q_num: {} for q_num in QUESTION_NUMBERS}
+    for row in rows:
+        totals[row['question_no']][row['relationship']] = (
+            row['score_total'], row['response_count'], row['score_squares']
+        )
+    return totals
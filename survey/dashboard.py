@@ -0,0 +1,45 @@
+"""Cached admin dashboard statistics for the survey application."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Survey, SurveyResponse
+
+
+DASHBOARD_STATS_CACHE_KEY = 'survey:dashboard_stats'
+
+
+def compute_dashboard_stats():
+    """Compute dashboard totals with two aggregate queries."""
+    stats = Survey.objects.aggregate(
+        total_surveys=Count('id'),
+        active_surveys=Count('id', filter=Q(is_active=True)),
+        completed_surveys=Count('id', filter=Q(leader_completed_self=True)),
+        pending_self_assessments=Count('id', filter=Q(leader_completed_self=False)),
+    )
+    start_of_day = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    stats['responses_today'] = SurveyResponse.objects.filter(submitted_at__gte=start_of_day).count()
+    stats['updated_at'] = timezone.now().isoformat()
+    return stats
+
+
+def get_dashboard_stats():
+    """Return dashboard totals from the cache, computing them on a miss."""
+    stats = cache.get(DASHBOARD_STATS_CACHE_KEY)
+    if stats is None:
+        stats = refresh_dashboard_stats()
+    return stats
+
+
+def refresh_dashboard_stats():
+    """Recompute the dashboard totals and store them in the cache."""
+    stats = compute_dashboard_stats()
+    cache.set(DASHBOARD_STATS_CACHE_KEY, stats, getattr(settings, 'DASHBOARD_STATS_TIMEOUT', 300))
+    return stats
+
+
+def invalidate_dashboard_stats():
+    """Drop the cached totals so the next read recomputes them."""
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
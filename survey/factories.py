@@ -0,0 +1,165 @@
+"""Bulk data factories for benchmarks and load-test fixtures.
+
+Everything is inserted with bulk_create, and the derived data (running
+aggregates, long-format answers, survey counters) is rebuilt once per survey
+rather than per response, so seeding thousands of responses takes seconds.
+"""
+
+import json
+import random
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Survey, SurveyInvitation, SurveyResponse, StrengthRanking, OpportunityRanking, SurveyReport
+from .aggregates import QUESTION_NUMBERS, rebuild_question_aggregates
+from .answers import answers_enabled, backfill_answers
+from .services import STRENGTH_KEYS, OPPORTUNITY_KEYS
+
+
+# Keyed by stored score: 7 = significantly above ... 1 = significantly below
+LIKERT_WEIGHTS = {7: 5, 6: 15, 5: 25, 4: 35, 3: 15, 2: 4, 1: 1}
+
+RELATIONSHIP_WEIGHTS = {'supervisor': 5, 'peer': 40, 'teacher': 30, 'student': 15, 'parent': 10}
+
+
+def get_staff_user(username='bench-admin'):
+    """Return a staff user to own seeded surveys and log in as."""
+    user, _ = User.objects.get_or_create(
+        username=username,
+        defaults={'is_staff': True, 'email': f'{username}@example.com'},
+    )
+    return user
+
+
+def random_answers(rng):
+    """Random Likert scores for every question, keyed by field name."""
+    scores = rng.choices(list(LIKERT_WEIGHTS), weights=list(LIKERT_WEIGHTS.values()), k=len(QUESTION_NUMBERS))
+    return {f'q{q_num}_response': score for q_num, score in zip(QUESTION_NUMBERS, scores)}
+
+
+def build_response(survey, rng, relationship, invitation=None):
+    """Unsaved SurveyResponse with random answers; no invitation means a self-assessment."""
+    return SurveyResponse(
+        survey=survey,
+        invitation=invitation,
+        relationship=relationship,
+        is_leader_self_assessment=invitation is None,
+        continue_doing='Keep sharing the weekly updates.' if rng.random() > 0.3 else '',
+        stop_doing='Scheduling meetings during planning periods.' if rng.random() > 0.5 else '',
+        start_doing='Visiting classrooms more often.' if rng.random() > 0.4 else '',
+        **random_answers(rng),
+    )
+
+
+def build_rankings(response, rng):
+    """Five unsaved strength and five unsaved opportunity rankings for a saved response."""
+    strengths = [
+        StrengthRanking(response_id=response.pk, strength=key, rank=5 - i)
+        for i, key in enumerate(rng.sample(STRENGTH_KEYS, 5))
+    ]
+    opportunities = [
+        OpportunityRanking(response_id=response.pk, opportunity=key, rank=5 - i)
+        for i, key in enumerate(rng.sample(OPPORTUNITY_KEYS, 5))
+    ]
+    return strengths, opportunities
+
+
+def create_open_invitations(survey, count, prefix='open'):
+    """Bulk-create unused invitations, e.g. for benchmarking submissions."""
+    expires_at = timezone.now() + timedelta(days=14)
+    invitations = SurveyInvitation.objects.bulk_create([
+        SurveyInvitation(survey=survey, email=f'{prefix}{i}.{survey.pk}@example.com', expires_at=expires_at)
+        for i in range(count)
+    ])
+    Survey.objects.filter(pk=survey.pk).update(invitation_count=F('invitation_count') + count)
+    return invitations
+
+
+def api_payload(token):
+    """JSON body for a complete api_submit_survey call with the given invitation token."""
+    return json.dumps({
+        'invitation_token': token,
+        'relationship': 'teacher',
+        **{f'q{q_num}': 5 for q_num in QUESTION_NUMBERS},
+        'strengths': [{'key': key, 'rank': 5 - i} for i, key in enumerate(STRENGTH_KEYS[:5])],
+        'opportunities': [{'key': key, 'rank': 5 - i} for i, key in enumerate(OPPORTUNITY_KEYS[:5])],
+    })
+
+
+def form_payload():
+    """POST data for a complete participant submission."""
+    data = {f'q{q_num}_response': '6' for q_num in QUESTION_NUMBERS}
+    data.update({
+        'relationship': 'peer',
+        'strengths': [str(i) for i in range(5)],
+        'opportunities': [str(i) for i in range(5)],
+        'continue_doing': 'Keep it up.',
+    })
+    for i in range(5):
+        data[f'strength_rank_{i}'] = str(5 - i)
+        data[f'opportunity_rank_{i}'] = str(5 - i)
+    return data
+
+
+def seed_survey(owner, responses, rng=None, batch_size=500, leader_name='Bench Leader',
+                leader_email='bench.leader@example.com', title='Benchmark Assessment'):
+    """Create a completed survey with a self-assessment and ``responses`` participant responses.
+
+    Each participant gets a used invitation and five strength and opportunity
+    rankings. The survey's aggregates, answers and counters are rebuilt at the
+    end and an (unbuilt) report is attached.
+    """
+    rng = rng or random.Random()
+    survey = Survey.objects.create(
+        title=title,
+        created_by=owner,
+        leader_name=leader_name,
+        leader_email=leader_email,
+        leader_completed_self=True,
+    )
+
+    now = timezone.now()
+    invitations = SurveyInvitation.objects.bulk_create(
+        [
+            SurveyInvitation(
+                survey=survey,
+                email=f'rater{i}.{survey.pk}@example.com',
+                expires_at=now + timedelta(days=14),
+                used=True,
+                used_at=now,
+            )
+            for i in range(responses)
+        ],
+        batch_size=batch_size,
+    )
+
+    relationships = rng.choices(
+        list(RELATIONSHIP_WEIGHTS), weights=list(RELATIONSHIP_WEIGHTS.values()), k=responses
+    )
+    response_rows = [build_response(survey, rng, 'self')]
+    response_rows += [
+        build_response(survey, rng, relationship, invitation)
+        for invitation, relationship in zip(invitations, relationships)
+    ]
+    response_rows = SurveyResponse.objects.bulk_create(response_rows, batch_size=batch_size)
+
+    strengths = []
+    opportunities = []
+    for response in response_rows:
+        response_strengths, response_opportunities = build_rankings(response, rng)
+        strengths += response_strengths
+        opportunities += response_opportunities
+    StrengthRanking.objects.bulk_create(strengths, batch_size=batch_size)
+    OpportunityRanking.objects.bulk_create(opportunities, batch_size=batch_size)
+
+    rebuild_question_aggregates(survey)
+    if answers_enabled():
+        backfill_answers(survey, batch_size=batch_size)
+    Survey.objects.filter(pk=survey.pk).recount()
+    SurveyReport.objects.create(survey=survey)
+
+    survey.refresh_from_db()
+    return survey
@@ -83,23 +83,116 @@ class InvitationForm(forms.Form):
         return emails
 
 
-class LeaderSelfAssessmentForm(forms.ModelForm):
-    """Form for leader self-assessment."""
-    
-    # Dynamic fields for strengths and opportunities
-    strengths = forms.MultipleChoiceField(
-        choices=[],
+# Relationships a participant can pick; 'self' is reserved for the leader's self-assessment
+PARTICIPANT_RELATIONSHIP_CHOICES = [
+    ('supervisor', 'Supervisor/Manager'),
+    ('peer', 'Peer/Colleague'),
+    ('teacher', 'Teacher/Staff'),
+    ('student', 'Student'),
+    ('parent', 'Parent/Community Representative'),
+]
+
+
+class FixedChoicesMixin:
+    """For choice fields configured once per form class: form instances share the choices list.
+
+    Django deep-copies every field for each form instance; for 54 Likert
+    questions that is mostly copying the same choice tuples over and over.
+    """
+
+    def __deepcopy__(self, memo):
+        # Field.__deepcopy__ still copies the widget, validators and error messages
+        result = forms.Field.__deepcopy__(self, memo)
+        result._choices = self._choices
+        return result
+
+
+class LikertField(FixedChoicesMixin, forms.TypedChoiceField):
+    pass
+
+
+class RankingChoiceField(FixedChoicesMixin, forms.MultipleChoiceField):
+    pass
+
+
+class SurveyAnswerFormMetaclass(forms.models.ModelFormMetaclass):
+    """Runs the form class's configure_fields() once, when the class is created."""
+
+    def __new__(mcs, name, bases, attrs):
+        new_class = super().__new__(mcs, name, bases, attrs)
+        new_class.configure_fields(new_class.base_fields)
+        return new_class
+
+
+class SurveyAnswerForm(forms.ModelForm, metaclass=SurveyAnswerFormMetaclass):
+    """Shared base for the self-assessment and participant survey forms.
+
+    Question labels, Likert widgets, ranking choices and open-ended widgets are
+    set on ``base_fields`` once per class, so creating a form instance only
+    copies the fields and binds the data.
+    """
+
+    # Placeholder text for the continue/stop/start Textareas
+    open_ended_placeholders = {}
+
+    strengths = RankingChoiceField(
+        choices=[(str(i), choice) for i, choice in enumerate(get_strength_choices())],
         widget=forms.CheckboxSelectMultiple(attrs={'class': 'strength-checkbox'}),
         required=True,
         label="Select your top 5 strengths (you will rank them next)"
     )
     
-    opportunities = forms.MultipleChoiceField(
-        choices=[],
+    opportunities = RankingChoiceField(
+        choices=[(str(i), choice) for i, choice in enumerate(get_opportunity_choices())],
         widget=forms.CheckboxSelectMultiple(attrs={'class': 'opportunity-checkbox'}),
         required=True,
         label="Select your top 5 opportunities for improvement (you will rank them next)"
     )
+
+    @classmethod
+    def configure_fields(cls, fields):
+        """Adjust the generated ``base_fields`` in place; called once per form class."""
+        # Both forms keep the participants' "This leader" wording
+        for q_num, text in get_question_texts().items():
+            field_name = f'q{q_num}_response'
+            if field_name in fields:
+                field = SurveyResponse._meta.get_field(field_name).formfield(choices_form_class=LikertField)
+                field.label = text
+                field.widget = forms.RadioSelect(attrs={'class': 'likert-scale'})
+                # Explicitly set choices without empty option
+                field.choices = SurveyResponse.LIKERT_CHOICES
+                fields[field_name] = field
+
+        for field_name, placeholder in cls.open_ended_placeholders.items():
+            fields[field_name].widget = forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 4,
+                'placeholder': placeholder,
+            })
+    
+    def clean_strengths(self):
+        """Validate that exactly 5 strengths are selected."""
+        strengths = self.cleaned_data.get('strengths', [])
+        if len(strengths) != 5:
+            raise forms.ValidationError("Please select exactly 5 strengths.")
+        return strengths
+    
+    def clean_opportunities(self):
+        """Validate that exactly 5 opportunities are selected."""
+        opportunities = self.cleaned_data.get('opportunities', [])
+        if len(opportunities) != 5:
+            raise forms.ValidationError("Please select exactly 5 opportunities for improvement.")
+        return opportunities
+
+
+class LeaderSelfAssessmentForm(SurveyAnswerForm):
+    """Form for leader self-assessment."""
+
+    open_ended_placeholders = {
+        'continue_doing': 'What positive behaviors should you continue?',
+        'stop_doing': 'What behaviors should you stop?',
+        'start_doing': 'What new behaviors should you start?',
+    }
     
     class Meta:
         model = SurveyResponse
@@ -117,80 +210,16 @@ class LeaderSelfAssessmentForm(forms.ModelForm):
             'q52_response', 'q53_response', 'q54_response', 'q55_response',
             'continue_doing', 'stop_doing', 'start_doing'
         ]
-        
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Set up Likert scale fields - use same text as participants
-        question_texts = get_question_texts()
-        for i in range(2, 56):
-            field_name = f'q{i}_response'
-            if field_name in self.fields:
-                # Keep original "This leader" text for self-assessment too
-                self.fields[field_name].label = question_texts[i]
-                self.fields[field_name].widget = forms.RadioSelect(
-                    attrs={'class': 'likert-scale'}
-                )
-                # Explicitly set choices without empty option
-                self.fields[field_name].choices = SurveyResponse.LIKERT_CHOICES
-                self.fields[field_name].empty_label = None
-        
-        # Set up strengths and opportunities choices
-        strength_choices = [(str(i), choice) for i, choice in enumerate(get_strength_choices())]
-        opportunity_choices = [(str(i), choice) for i, choice in enumerate(get_opportunity_choices())]
-        
-        self.fields['strengths'].choices = strength_choices
-        self.fields['opportunities'].choices = opportunity_choices
-        
-        # Set up open-ended fields
-        self.fields['continue_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What positive behaviors should you continue?'
-        })
-        self.fields['stop_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What behaviors should you stop?'
-        })
-        self.fields['start_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What new behaviors should you start?'
-        })
-    
-    def clean_strengths(self):
-        """Validate that exactly 5 strengths are selected."""
-        strengths = self.cleaned_data.get('strengths', [])
-        if len(strengths) != 5:
-            raise forms.ValidationError("Please select exactly 5 strengths.")
-        return strengths
-    
-    def clean_opportunities(self):
-        """Validate that exactly 5 opportunities are selected."""
-        opportunities = self.cleaned_data.get('opportunities', [])
-        if len(opportunities) != 5:
-            raise forms.ValidationError("Please select exactly 5 opportunities for improvement.")
-        return opportunities
 
 
-class SurveyResponseForm(forms.ModelForm):
+class SurveyResponseForm(SurveyAnswerForm):
     """Form for participant survey responses (excludes Self relationship)."""
-    
-    # Dynamic fields for strengths and opportunities
-    strengths = forms.MultipleChoiceField(
-        choices=[],
-        widget=forms.CheckboxSelectMultiple(attrs={'class': 'strength-checkbox'}),
-        required=True,
-        label="Select your top 5 strengths (you will rank them next)"
-    )
-    
-    opportunities = forms.MultipleChoiceField(
-        choices=[],
-        widget=forms.CheckboxSelectMultiple(attrs={'class': 'opportunity-checkbox'}),
-        required=True,
-        label="Select your top 5 opportunities for improvement (you will rank them next)"
-    )
+
+    open_ended_placeholders = {
+        'continue_doing': 'What positive behaviors should this leader continue?',
+        'stop_doing': 'What behaviors should this leader stop?',
+        'start_doing': 'What new behaviors should this leader start?',
+    }
     
     class Meta:
         model = SurveyResponse
@@ -209,71 +238,10 @@ class SurveyResponseForm(forms.ModelForm):
             'q52_response', 'q53_response', 'q54_response', 'q55_response',
             'continue_doing', 'stop_doing', 'start_doing'
         ]
-        
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Set up relationship field - exclude 'Self' for participant surveys
-        participant_choices = [
-            ('supervisor', 'Supervisor/Manager'),
-            ('peer', 'Peer/Colleague'),
-            ('teacher', 'Teacher/Staff'),
-            ('student', 'Student'),
-            ('parent', 'Parent/Community Representative'),
-        ]
-        self.fields['relationship'].choices = participant_choices
-        self.fields['relationship'].widget = forms.RadioSelect(
-            attrs={'class': 'form-check-input'}
-        )
-        
-        # Set up Likert scale fields
-        question_texts = get_question_texts()
-        for i in range(2, 56):
-            field_name = f'q{i}_response'
-            if field_name in self.fields:
-                # Keep original text for participants (about "This leader")
-                self.fields[field_name].label = question_texts[i]
-                self.fields[field_name].widget = forms.RadioSelect(
-                    attrs={'class': 'likert-scale'}
-                )
-                # Explicitly set choices without empty option
-                self.fields[field_name].choices = SurveyResponse.LIKERT_CHOICES
-                self.fields[field_name].empty_label = None
-        
-        # Set up strengths and opportunities choices
-        strength_choices = [(str(i), choice) for i, choice in enumerate(get_strength_choices())]
-        opportunity_choices = [(str(i), choice) for i, choice in enumerate(get_opportunity_choices())]
-        
-        self.fields['strengths'].choices = strength_choices
-        self.fields['opportunities'].choices = opportunity_choices
-        
-        # Set up open-ended fields
-        self.fields['continue_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What positive behaviors should this leader continue?'
-        })
-        self.fields['stop_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What behaviors should this leader stop?'
-        })
-        self.fields['start_doing'].widget = forms.Textarea(attrs={
-            'class': 'form-control',
-            'rows': 4,
-            'placeholder': 'What new behaviors should this leader start?'
-        })
-    
-    def clean_strengths(self):
-        """Validate that exactly 5 strengths are selected."""
-        strengths = self.cleaned_data.get('strengths', [])
-        if len(strengths) != 5:
-            raise forms.ValidationError("Please select exactly 5 strengths.")
-        return strengths
-    
-    def clean_opportunities(self):
-        """Validate that exactly 5 opportunities are selected."""
-        opportunities = self.cleaned_data.get('opportunities', [])
-        if len(opportunities) != 5:
-            raise forms.ValidationError("Please select exactly 5 opportunities for improvement.")
-        return opportunities
\ No newline at end of file
+
+    @classmethod
+    def configure_fields(cls, fields):
+        super().configure_fields(fields)
+        # Exclude 'Self' for participant surveys
+        fields['relationship'].widget = forms.RadioSelect(attrs={'class': 'form-check-input'})
+        fields['relationship'].choices = PARTICIPANT_RELATIONSHIP_CHOICES
@@ -0,0 +1,41 @@
+"""
+Management command to (re)build the long-format Answer rows from stored responses.
+Usage: python manage.py backfill_answers [--survey ID] [--batch-size 500]
+"""
+
+from django.core.management.base import BaseCommand
+
+from survey.models import Survey
+from survey.answers import backfill_answers
+
+
+class Command(BaseCommand):
+    help = 'Rebuild long-format Answer rows from the wide survey response columns'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey',
+            type=int,
+            action='append',
+            dest='survey_ids',
+            help='Only backfill the given survey ID (may be repeated)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of Answer rows inserted per statement (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options['survey_ids']:
+            surveys = surveys.filter(id__in=options['survey_ids'])
+        
+        backfilled = 0
+        answers = 0
+        for survey in surveys.iterator():
+            answers += backfill_answers(survey, batch_size=options['batch_size'])
+            backfilled += 1
+        
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {answers} answers for {backfilled} surveys'))
@@ -0,0 +1,251 @@
+"""
+Management command to benchmark the main views and enforce query/latency budgets.
+Usage: python manage.py bench [--sizes 10,100,1000] [--repeat 5] [--latency-scale 1.0] [--no-budgets]
+
+Runs against a throwaway test database (like the test runner), seeds one
+survey per size with survey.factories, then times each scenario through the
+test client while counting queries with CaptureQueriesContext. Query budgets
+are independent of survey size, so any N+1 regression fails the run, and no
+scenario may write to the session table: sessions are only saved when they
+change (SESSION_SAVE_EVERY_REQUEST=False) and flash messages live in a cookie
+(CookieStorage), whichever SESSION_BACKEND is used.
+
+Each timed request is wrapped in close_old_connections() like a real request
+boundary, so p50/p99 include reconnects when DB_CONN_MAX_AGE=0 (SQLite's
+in-memory test database is never closed; compare settings on PostgreSQL).
+
+A microbenchmark also times creating the survey forms, unbound (GET) and
+bound and validated (POST), in microseconds per form (best of --repeat).
+"""
+
+import random
+import statistics
+import time
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, close_old_connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from survey.factories import get_staff_user, seed_survey, create_open_invitations, api_payload, form_payload
+from survey.forms import LeaderSelfAssessmentForm, SurveyResponseForm
+from survey.reports import invalidate_report_snapshot
+
+
+# scenario: (max queries, max median milliseconds), enforced at every survey size
+BUDGETS = {
+    'view_report': (1, 50),
+    # The rebuild includes one scan of the answer columns for the score distributions
+    'view_report (cold)': (9, 150),
+    # Staff views include one session read; with a shared cache and cached_db sessions it is served
+    # from the cache instead
+    'survey_list_view': (3, 50),
+    'survey_detail_view': (6, 100),
+    'admin_dashboard_view': (4, 50),
+    'leader_dashboard_view': (2, 50),
+    'participant_survey_view GET': (2, 80),
+    'participant_survey_view POST': (13, 150),
+    'api_submit_survey': (12, 150),
+}
+
+# form: (max microseconds unbound, max microseconds bound and validated)
+FORM_BUDGETS = {
+    'LeaderSelfAssessmentForm': (1500, 3000),
+    'SurveyResponseForm': (1500, 3000),
+}
+
+FORM_ITERATIONS = 100
+
+
+def count_session_writes(captured_queries):
+    """Number of INSERT/UPDATE/DELETE statements against the session table."""
+    return sum(
+        1 for query in captured_queries
+        if 'django_session' in query['sql'] and query['sql'].lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))
+    )
+
+
+class Command(BaseCommand):
+    help = 'Benchmark view latency and query counts against fixed budgets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='10,100,1000',
+            help='Comma-separated responses per seeded survey (default: 10,100,1000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timed runs per scenario; p50 and p99 are reported (default: 5)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=360,
+            help='Random seed for the generated data (default: 360)'
+        )
+        parser.add_argument(
+            '--latency-scale',
+            type=float,
+            default=1.0,
+            help='Multiply the latency budgets, e.g. 2 on slow CI machines (default: 1.0)'
+        )
+        parser.add_argument(
+            '--no-budgets',
+            action='store_true',
+            help='Report results without failing on budget violations'
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        self.repeat = options['repeat']
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            results = self.run_benchmarks(sizes, random.Random(options['seed']))
+            form_results = self.run_form_benchmarks()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.report(results, form_results)
+        if not options['no_budgets']:
+            self.enforce_budgets(results, form_results, options['latency_scale'])
+
+    def run_benchmarks(self, sizes, rng):
+        """Return [(scenario, size, p50_ms, p99_ms, queries, session_writes)]."""
+        staff = get_staff_user()
+        staff_client = Client()
+        staff_client.force_login(staff)
+        client = Client()
+
+        results = []
+        for size in sizes:
+            self.stdout.write(f'Seeding a survey with {size} responses...')
+            survey = seed_survey(staff, size, rng=rng, leader_email=f'leader{size}@example.com')
+            report_url = reverse('view_report', args=[survey.report.report_token])
+            leader_dashboard_url = reverse('leader_dashboard', args=[survey.leader_token])
+            # One for the GET scenario plus a warm-up and `repeat` runs for each submission scenario
+            open_invitations = iter(create_open_invitations(survey, 1 + 2 * (self.repeat + 1)))
+
+            scenarios = [
+                ('view_report', None, lambda: client.get(report_url)),
+                ('view_report (cold)', lambda: invalidate_report_snapshot(survey), lambda: client.get(report_url)),
+                ('survey_list_view', None, lambda: staff_client.get(reverse('survey_list'))),
+                ('survey_detail_view', None, lambda: staff_client.get(reverse('survey_detail', args=[survey.pk]))),
+                ('admin_dashboard_view', None, lambda: staff_client.get(reverse('admin_dashboard'))),
+                ('leader_dashboard_view', None, lambda: client.get(leader_dashboard_url)),
+            ]
+            get_invitation = next(open_invitations)
+            scenarios.append((
+                'participant_survey_view GET', None,
+                lambda: client.get(reverse('participant_survey', args=[get_invitation.token])),
+            ))
+            scenarios.append(self.submission_scenario(
+                'participant_survey_view POST', open_invitations,
+                lambda invitation: client.post(reverse('participant_survey', args=[invitation.token]), form_payload()),
+            ))
+            scenarios.append(self.submission_scenario(
+                'api_submit_survey', open_invitations,
+                lambda invitation: client.post(
+                    reverse('api_submit', args=[invitation.token]), api_payload(invitation.token),
+                    content_type='application/json',
+                ),
+            ))
+
+            for name, prepare, request in scenarios:
+                results.append((name, size, *self.measure(prepare, request)))
+        return results
+
+    def run_form_benchmarks(self):
+        """Return [(form, unbound_us, bound_us)]."""
+        data = form_payload()
+        results = []
+        for form_class in (LeaderSelfAssessmentForm, SurveyResponseForm):
+            unbound = timeit.repeat(form_class, number=FORM_ITERATIONS, repeat=self.repeat)
+            bound = timeit.repeat(lambda: form_class(data).is_valid(), number=FORM_ITERATIONS, repeat=self.repeat)
+            results.append((
+                form_class.__name__,
+                min(unbound) / FORM_ITERATIONS * 1e6,
+                min(bound) / FORM_ITERATIONS * 1e6,
+            ))
+        return results
+
+    def submission_scenario(self, name, open_invitations, submit):
+        """Each run submits with a fresh invitation picked before the timer starts."""
+        state = {}
+
+        def prepare():
+            state['invitation'] = next(open_invitations)
+
+        return name, prepare, lambda: submit(state['invitation'])
+
+    def measure(self, prepare, request):
+        """Warm up once, then time ``repeat`` runs; return (p50 ms, p99 ms, max queries, max session writes)."""
+        if prepare:
+            prepare()
+        self.check_response(request())
+
+        timings = []
+        queries = 0
+        session_writes = 0
+        for _ in range(self.repeat):
+            if prepare:
+                prepare()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                # The test client skips the request_started/finished connection handling
+                close_old_connections()
+                response = request()
+                close_old_connections()
+                timings.append((time.perf_counter() - start) * 1000)
+            self.check_response(response)
+            queries = max(queries, len(captured.captured_queries))
+            session_writes = max(session_writes, count_session_writes(captured.captured_queries))
+        p99 = statistics.quantiles(timings, n=100, method='inclusive')[98] if len(timings) > 1 else timings[0]
+        return statistics.median(timings), p99, queries, session_writes
+
+    def check_response(self, response):
+        if response.status_code >= 400:
+            raise CommandError(f'{response.request["PATH_INFO"]} returned {response.status_code}')
+
+    def report(self, results, form_results):
+        self.stdout.write(
+            f'\n{"scenario":<32}{"responses":>10}{"p50 ms":>9}{"p99 ms":>9}{"queries":>9}{"session writes":>16}'
+        )
+        for name, size, p50_ms, p99_ms, queries, session_writes in results:
+            self.stdout.write(
+                f'{name:<32}{size:>10}{p50_ms:>9.1f}{p99_ms:>9.1f}{queries:>9}{session_writes:>16}'
+            )
+
+        self.stdout.write(f'\n{"form":<32}{"unbound us":>12}{"bound us":>12}')
+        for name, unbound_us, bound_us in form_results:
+            self.stdout.write(f'{name:<32}{unbound_us:>12.0f}{bound_us:>12.0f}')
+
+    def enforce_budgets(self, results, form_results, latency_scale):
+        violations = []
+        for name, size, median_ms, _p99_ms, queries, session_writes in results:
+            max_queries, max_ms = BUDGETS[name]
+            if queries > max_queries:
+                violations.append(f'{name} @ {size}: {queries} queries (budget {max_queries})')
+            if median_ms > max_ms * latency_scale:
+                violations.append(f'{name} @ {size}: {median_ms:.1f} ms (budget {max_ms * latency_scale:.0f} ms)')
+            if session_writes:
+                violations.append(f'{name} @ {size}: {session_writes} session writes (budget 0)')
+        for name, unbound_us, bound_us in form_results:
+            max_unbound_us, max_bound_us = FORM_BUDGETS[name]
+            if unbound_us > max_unbound_us * latency_scale:
+                violations.append(f'{name}(): {unbound_us:.0f} us (budget {max_unbound_us * latency_scale:.0f} us)')
+            if bound_us > max_bound_us * latency_scale:
+                violations.append(f'{name}(data): {bound_us:.0f} us (budget {max_bound_us * latency_scale:.0f} us)')
+
+        if violations:
+            for violation in violations:
+                self.stdout.write(self.style.ERROR(f'❌ {violation}'))
+            raise CommandError(f'{len(violations)} benchmark budgets exceeded')
+        self.stdout.write(self.style.SUCCESS('✅ All scenarios within budget'))
@@ -0,0 +1,62 @@
+"""
+Management command to verify that every report statistics backend agrees.
+Usage: python manage.py check_report_backends [--survey ID] [--backend NAME]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from survey.models import Survey
+from survey.reports import build_question_stats
+from survey.stats_backends import STATS_BACKENDS, get_question_totals, backend_unavailable_reason
+
+
+class Command(BaseCommand):
+    help = 'Compare report statistics from each backend against the pure-Python reference'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey',
+            type=int,
+            action='append',
+            dest='survey_ids',
+            help='Only check the given survey ID (may be repeated)'
+        )
+        parser.add_argument(
+            '--backend',
+            action='append',
+            dest='backends',
+            choices=sorted(STATS_BACKENDS),
+            help='Backend to compare against the reference (default: all)'
+        )
+
+    def handle(self, *args, **options):
+        backends = options['backends'] or [name for name in STATS_BACKENDS if name != 'python']
+        unavailable = {name: backend_unavailable_reason(name) for name in backends}
+        unavailable = {name: reason for name, reason in unavailable.items() if reason}
+        for name, reason in unavailable.items():
+            if options['backends']:
+                raise CommandError(f'Backend {name} is not available: {reason}')
+            self.stdout.write(self.style.WARNING(f'Skipping {name}: {reason}'))
+        backends = [name for name in backends if name not in unavailable]
+        surveys = Survey.objects.all()
+        if options['survey_ids']:
+            surveys = surveys.filter(id__in=options['survey_ids'])
+        
+        mismatches = []
+        checked = 0
+        for survey in surveys.iterator():
+            expected = build_question_stats(get_question_totals(survey, backend='python'))
+            for backend in backends:
+                actual = build_question_stats(get_question_totals(survey, backend=backend))
+                if actual != expected:
+                    mismatches.append(f'survey {survey.id} ({survey.leader_name}): {backend}')
+            checked += 1
+        
+        if mismatches:
+            for mismatch in mismatches:
+                self.stdout.write(self.style.ERROR(f'❌ Mismatch for {mismatch}'))
+            raise CommandError(f'{len(mismatches)} backend mismatches across {checked} surveys')
+        
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {", ".join(backends)} match the python backend for {checked} surveys'
+        ))
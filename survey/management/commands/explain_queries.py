@@ -0,0 +1,128 @@
+"""
+Management command to check that the hot view queries are served by their indexes.
+Usage: python manage.py explain_queries [--verbose-plans]
+
+Runs EXPLAIN for each query on SQLite or PostgreSQL and fails if the plan
+does not mention the expected index. On PostgreSQL sequential scans are
+disabled for the check, since tiny development tables would otherwise always
+be scanned in full.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from survey.models import Survey, SurveyInvitation, SurveyResponse, OutgoingEmail
+
+
+def get_checks():
+    """Return [(label, queryset, expected index name)] mirroring the view queries."""
+    survey_id = Survey.objects.values_list('id', flat=True).first() or 0
+    now = timezone.now()
+    checks = [
+        (
+            'survey list, pending self-assessment',
+            Survey.objects.filter(leader_completed_self=False).order_by('-created_at', '-id')[:26],
+            'survey_self_created_idx',
+        ),
+        (
+            'survey list, active',
+            Survey.objects.filter(is_active=True).order_by('-created_at', '-id')[:26],
+            'survey_active_created_idx',
+        ),
+        (
+            'survey list, self-assessment complete',
+            Survey.objects.filter(leader_completed_self=True).order_by('-created_at', '-id')[:26],
+            'survey_completed_created_idx',
+        ),
+        (
+            'survey detail, invitation status counts',
+            SurveyInvitation.objects.filter(survey_id=survey_id).order_by().values('survey').annotate(
+                pending=Count('id', filter=Q(used=False, expires_at__gt=now)),
+                expired=Count('id', filter=Q(used=False, expires_at__lte=now)),
+            ),
+            'invitation_status_idx',
+        ),
+        (
+            'survey detail, invitation table',
+            SurveyInvitation.objects.filter(survey_id=survey_id).order_by('-sent_at')[:25],
+            'invitation_survey_sent_idx',
+        ),
+        (
+            'survey detail, response table',
+            SurveyResponse.objects.filter(survey_id=survey_id).only('id', 'relationship', 'submitted_at')[:25],
+            'response_survey_submitted_idx',
+        ),
+        (
+            'report, relationship counts',
+            SurveyResponse.objects.filter(survey_id=survey_id).order_by().values('relationship').annotate(
+                total=Count('id')
+            ),
+            'response_survey_rel_idx',
+        ),
+        (
+            'report, participant count',
+            SurveyResponse.objects.filter(survey_id=survey_id, is_leader_self_assessment=False).order_by().values('id'),
+            'response_participant_idx',
+        ),
+        (
+            'admin dashboard, responses today',
+            SurveyResponse.objects.filter(submitted_at__gte=now).order_by().values('id'),
+            'response_submitted_idx',
+        ),
+        (
+            'email worker, pending batch',
+            OutgoingEmail.objects.filter(status='pending', attempts__lt=3).order_by('created_at')[:50],
+            'outgoing_email_pending_idx',
+        ),
+    ]
+    if connection.vendor == 'postgresql':
+        # The trigram indexes from migration 0016 only exist on PostgreSQL; SQLite scans for a search
+        search = 'principal'
+        checks.append((
+            'survey list, search',
+            Survey.objects.filter(
+                Q(leader_name__icontains=search) | Q(leader_email__icontains=search) | Q(title__icontains=search)
+            ).order_by('-created_at', '-id')[:26],
+            'survey_title_trgm_idx',
+        ))
+    return checks
+
+
+class Command(BaseCommand):
+    help = 'Verify with EXPLAIN that the hot view queries use their indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help='Print the full query plan for every check'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            raise CommandError(f'Query plans are only checked on SQLite and PostgreSQL, not {connection.vendor}')
+
+        failures = []
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for label, queryset, index_name in get_checks():
+                plan = queryset.explain()
+                if options['verbose_plans']:
+                    self.stdout.write(f'{label}:\n{plan}\n')
+                if index_name in plan:
+                    self.stdout.write(f'✅ {label}: {index_name}')
+                else:
+                    self.stdout.write(self.style.ERROR(f'❌ {label}: expected {index_name}'))
+                    failures.append((label, plan))
+
+        if failures:
+            for label, plan in failures:
+                self.stdout.write(f'\n{label}:\n{plan}')
+            raise CommandError(f'{len(failures)} queries are not using their expected index')
+
+        self.stdout.write(self.style.SUCCESS('All checked queries use their indexes'))
@@ -1,11 +1,37 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import connection, connections
 from survey.models import Survey, SurveyInvitation, SurveyResponse, StrengthRanking, OpportunityRanking, SurveyReport
-from survey.utils import get_strength_choices, get_opportunity_choices
+from survey.aggregates import QUESTION_NUMBERS, rebuild_question_aggregates
+from survey.answers import answers_enabled, backfill_answers
+from survey.factories import seed_survey
 from datetime import datetime, timedelta
+import multiprocessing
 import random
 import secrets
 import string
+import time
+
+
+def seed_bulk_survey(job):
+    """Seed one survey for --bulk mode; runs in the parent or a worker process.
+
+    Returns the number of rows inserted: invitations, responses, rankings and
+    (when enabled) the 54 long-format answers per response.
+    """
+    owner_id, leader_name, leader_email, title, num_responses, seed, batch_size = job
+    owner = User.objects.get(pk=owner_id)
+    seed_survey(
+        owner, num_responses, rng=random.Random(seed), batch_size=batch_size,
+        leader_name=leader_name, leader_email=leader_email, title=title,
+    )
+    rows_per_response = 1 + 10 + (len(QUESTION_NUMBERS) if answers_enabled() else 0)
+    return num_responses + (num_responses + 1) * rows_per_response
+
+
+def close_inherited_connections():
+    """Worker initializer: never share the parent's database connection across a fork."""
+    connections.close_all()
 
 
 class Command(BaseCommand):
@@ -66,14 +92,15 @@ class Command(BaseCommand):
     ]
     
     # Realistic survey responses based on typical patterns
+    # Keyed by stored score: 7 = significantly above ... 1 = significantly below
     LIKERT_WEIGHTS = {
-        'significantly_above': 5,
-        'above': 15,
-        'slightly_above': 25,
-        'meets': 35,
-        'slightly_below': 15,
-        'below': 4,
-        'significantly_below': 1,
+        7: 5,
+        6: 15,
+        5: 25,
+        4: 35,
+        3: 15,
+        2: 4,
+        1: 1,
     }
     
     RELATIONSHIP_WEIGHTS = {
@@ -153,32 +180,55 @@ class Command(BaseCommand):
             default=100,
             help='Maximum responses per leader (default: 100)'
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Load-test mode: any number of synthesized leaders, inserted with bulk_create'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per INSERT in --bulk mode (default: 1000)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Worker processes seeding surveys in parallel in --bulk mode (default: 1)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed for reproducible data'
+        )
+        parser.add_argument(
+            '--append',
+            action='store_true',
+            help='Keep existing surveys instead of clearing them first'
+        )
     
     def handle(self, *args, **options):
         num_leaders = options['leaders']
         min_responses = options['min_responses']
         max_responses = options['max_responses']
         
+        if options['seed'] is not None:
+            random.seed(options['seed'])
+        
         self.stdout.write(self.style.SUCCESS('🚀 Starting dummy data generation...'))
         self.stdout.write(f'Creating {num_leaders} leaders with {min_responses}-{max_responses} responses each')
         
-        # Clear existing dummy data (keep admin user)
-        self.stdout.write('Clearing existing dummy data...')
-        Survey.objects.all().delete()
+        if not options['append']:
+            # Clear existing dummy data (keep admin user)
+            self.stdout.write('Clearing existing dummy data...')
+            Survey.objects.all().delete()
         
-        # Get or create admin user
-        admin_user = User.objects.filter(is_staff=True).first()
-        if not admin_user:
-            admin_user = User.objects.create_user(
-                username='admin',
-                email='admin@principal360.com',
-                password='admin123',
-                first_name='Eddie',
-                last_name='Admin',
-                is_staff=True,
-                is_superuser=True
-            )
-            self.stdout.write(self.style.SUCCESS('Created admin user'))
+        admin_user = self.get_admin_user()
+        
+        if options['bulk']:
+            self.handle_bulk(admin_user, options)
+            return
         
         leaders_created = 0
         total_responses = 0
@@ -246,6 +296,13 @@ class Command(BaseCommand):
         # Generate some surveys in different states
         self.create_partial_surveys(admin_user)
         
+        # Responses were inserted directly, so build the counters and running aggregates in one pass
+        Survey.objects.recount()
+        for survey in Survey.objects.all():
+            rebuild_question_aggregates(survey)
+            if answers_enabled():
+                backfill_answers(survey)
+        
         self.stdout.write('\n' + '='*60)
         self.stdout.write(self.style.SUCCESS('🎉 Dummy data generation complete!'))
         self.stdout.write('='*60)
@@ -267,6 +324,76 @@ class Command(BaseCommand):
         self.stdout.write('📧 Login: admin / admin123')
         self.stdout.write('='*60)
 
+    def get_admin_user(self):
+        """Return the first staff user, creating the demo admin if there is none."""
+        admin_user = User.objects.filter(is_staff=True).first()
+        if not admin_user:
+            admin_user = User.objects.create_user(
+                username='admin',
+                email='admin@principal360.com',
+                password='admin123',
+                first_name='Eddie',
+                last_name='Admin',
+                is_staff=True,
+                is_superuser=True
+            )
+            self.stdout.write(self.style.SUCCESS('Created admin user'))
+        return admin_user
+
+    def handle_bulk(self, admin_user, options):
+        """Seed production-scale data with bulk inserts, optionally across processes."""
+        rng = random.Random(options['seed'])
+        workers = options['workers']
+        if workers > 1 and connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING('SQLite allows a single writer; using 1 worker'))
+            workers = 1
+        
+        # Leader identities and per-survey seeds are drawn up front so the data
+        # does not depend on how surveys are spread across workers
+        jobs = []
+        for i in range(options['leaders']):
+            first_name = rng.choice(self.FIRST_NAMES)
+            last_name = rng.choice(self.LAST_NAMES)
+            jobs.append((
+                admin_user.pk,
+                f'{first_name} {last_name}',
+                f'{first_name.lower()}.{last_name.lower()}{i}@leaders.edu',
+                f'Leadership Assessment - Q{rng.randint(1, 4)} 202{rng.randint(3, 5)}',
+                rng.randint(options['min_responses'], options['max_responses']),
+                rng.getrandbits(32),
+                options['batch_size'],
+            ))
+        
+        start = time.perf_counter()
+        rows = 0
+        surveys = 0
+        if workers > 1:
+            connections.close_all()
+            with multiprocessing.Pool(workers, initializer=close_inherited_connections) as pool:
+                results = pool.imap_unordered(seed_bulk_survey, jobs)
+                for rows_inserted in results:
+                    rows += rows_inserted
+                    surveys += 1
+                    self.report_bulk_progress(surveys, rows, start)
+        else:
+            for job in jobs:
+                rows += seed_bulk_survey(job)
+                surveys += 1
+                self.report_bulk_progress(surveys, rows, start)
+        
+        elapsed = time.perf_counter() - start
+        responses = sum(job[4] + 1 for job in jobs)
+        self.stdout.write('\n' + '='*60)
+        self.stdout.write(self.style.SUCCESS('🎉 Bulk data generation complete!'))
+        self.stdout.write(f'✅ {surveys} surveys, {responses} responses, {rows} rows in {elapsed:.1f}s')
+        self.stdout.write(f'✅ {rows / elapsed:,.0f} rows/sec ({responses / elapsed:,.0f} responses/sec)')
+        self.stdout.write('='*60)
+
+    def report_bulk_progress(self, surveys, rows, start):
+        if surveys % 10 == 0:
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'Seeded {surveys} surveys, {rows} rows ({rows / elapsed:,.0f} rows/sec)')
+
     def weighted_choice(self, choices):
         """Choose random item based on weights."""
         items = list(choices.keys())
@@ -297,7 +424,7 @@ class Command(BaseCommand):
         )
         
         # Create strength rankings
-        strength_choices = get_strength_choices()
+        strength_choices = [key for key, _ in StrengthRanking.STRENGTH_CHOICES]
         selected_strengths = random.sample(strength_choices, 5)
         
         for i, strength in enumerate(selected_strengths):
@@ -308,7 +435,7 @@ class Command(BaseCommand):
             )
         
         # Create opportunity rankings
-        opportunity_choices = get_opportunity_choices()
+        opportunity_choices = [key for key, _ in OpportunityRanking.OPPORTUNITY_CHOICES]
         selected_opportunities = random.sample(opportunity_choices, 5)
         
         for i, opportunity in enumerate(selected_opportunities):
@@ -0,0 +1,177 @@
+"""
+Management command to load-test the report and submission paths over HTTP.
+Usage: python manage.py load_test [--profiles sync,gthread,uvicorn] [--url http://host:port]
+                                  [--requests 200] [--concurrency 16] [--responses 100]
+
+Seeds one survey in the configured database, then fires concurrent requests at
+view_report and api_submit_survey (one fresh invitation per submission) and
+reports throughput and p50/p99 latency. With --profiles, a local gunicorn is
+started from gunicorn.conf.py for each GUNICORN_PROFILE in turn so the worker
+models can be compared on the same data; with --url an already running server
+is tested instead. The seeded survey is deleted afterwards unless --keep-data.
+"""
+
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from survey.factories import get_staff_user, seed_survey, create_open_invitations, api_payload
+
+
+def timed_request(url, data=None):
+    """Send one request; return (milliseconds, ok)."""
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'} if data else {})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            ok = response.status < 400
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return (time.perf_counter() - start) * 1000, ok
+
+
+class Command(BaseCommand):
+    help = 'Load-test the report and submit paths, optionally against each gunicorn profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profiles',
+            help='Comma-separated GUNICORN_PROFILE values to start and compare, e.g. sync,gthread,uvicorn'
+        )
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Base URL of a running server, used when --profiles is not given'
+        )
+        parser.add_argument(
+            '--port',
+            type=int,
+            default=8100,
+            help='Port for the gunicorn servers started by --profiles (default: 8100)'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per scenario and target (default: 200)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=16,
+            help='Concurrent clients (default: 16)'
+        )
+        parser.add_argument(
+            '--responses',
+            type=int,
+            default=100,
+            help='Responses in the seeded survey (default: 100)'
+        )
+        parser.add_argument(
+            '--keep-data',
+            action='store_true',
+            help='Keep the seeded survey instead of deleting it afterwards'
+        )
+
+    def handle(self, *args, **options):
+        profiles = options['profiles'].split(',') if options['profiles'] else [None]
+        self.requests = options['requests']
+        self.concurrency = options['concurrency']
+
+        self.stdout.write(f'Seeding a survey with {options["responses"]} responses...')
+        survey = seed_survey(
+            get_staff_user('loadtest-admin'), options['responses'], rng=random.Random(360),
+            leader_email='load.test.leader@example.com', title='Load Test Assessment',
+        )
+        # Each target submits `requests` times, plus one warm-up
+        invitations = iter(create_open_invitations(survey, len(profiles) * (self.requests + 1), prefix='load'))
+
+        results = []
+        try:
+            for profile in profiles:
+                if profile is None:
+                    results += self.run_scenarios(options['url'].rstrip('/'), survey, invitations, 'server')
+                    continue
+                server = self.start_server(profile, options['port'])
+                try:
+                    base_url = f'http://127.0.0.1:{options["port"]}'
+                    results += self.run_scenarios(base_url, survey, invitations, profile)
+                finally:
+                    server.terminate()
+                    server.wait(timeout=30)
+        finally:
+            if not options['keep_data']:
+                survey.delete()
+
+        self.report(results)
+
+    def start_server(self, profile, port):
+        """Start gunicorn with the given profile and wait until it answers."""
+        env = dict(
+            os.environ,
+            GUNICORN_PROFILE=profile,
+            GUNICORN_BIND=f'127.0.0.1:{port}',
+            GUNICORN_ACCESS_LOG='',
+            GUNICORN_ERROR_LOG='-',
+        )
+        self.stdout.write(f'Starting gunicorn ({profile})...')
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '--config', str(settings.BASE_DIR / 'gunicorn.conf.py')],
+            cwd=settings.BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'gunicorn ({profile}) exited with status {server.returncode}')
+            try:
+                urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1).close()
+                return server
+            except urllib.error.HTTPError:
+                return server
+            except OSError:
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError(f'gunicorn ({profile}) did not start within 30 seconds')
+
+    def run_scenarios(self, base_url, survey, invitations, target):
+        """Return [(target, scenario, requests/s, p50 ms, p99 ms, errors)]."""
+        report_url = base_url + reverse('view_report', args=[survey.report.report_token])
+
+        def submit():
+            token = next(invitations).token
+            return timed_request(base_url + reverse('api_submit', args=[token]), api_payload(token).encode())
+
+        scenarios = [
+            ('view_report', lambda: timed_request(report_url)),
+            ('api_submit_survey', submit),
+        ]
+        results = []
+        for name, request in scenarios:
+            request()  # warm-up, e.g. builds the report snapshot
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                start = time.perf_counter()
+                samples = list(executor.map(lambda _: request(), range(self.requests)))
+                elapsed = time.perf_counter() - start
+            timings = [ms for ms, _ in samples]
+            errors = sum(1 for _, ok in samples if not ok)
+            results.append((
+                target, name, len(samples) / elapsed, statistics.median(timings),
+                statistics.quantiles(timings, n=100, method='inclusive')[98], errors,
+            ))
+        return results
+
+    def report(self, results):
+        self.stdout.write(f'\n{"target":<10}{"scenario":<20}{"req/s":>9}{"p50 ms":>9}{"p99 ms":>9}{"errors":>8}')
+        for target, name, throughput, p50_ms, p99_ms, errors in results:
+            self.stdout.write(f'{target:<10}{name:<20}{throughput:>9.1f}{p50_ms:>9.1f}{p99_ms:>9.1f}{errors:>8}')
@@ -0,0 +1,36 @@
+"""
+Management command to rebuild the running per-question score aggregates.
+Usage: python manage.py rebuild_aggregates [--survey ID]
+"""
+
+from django.core.management.base import BaseCommand
+
+from survey.models import Survey
+from survey.aggregates import rebuild_question_aggregates
+from survey.reports import invalidate_report_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Recompute per-question score aggregates from stored survey responses'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey',
+            type=int,
+            action='append',
+            dest='survey_ids',
+            help='Only rebuild the given survey ID (may be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options['survey_ids']:
+            surveys = surveys.filter(id__in=options['survey_ids'])
+        
+        rebuilt = 0
+        for survey in surveys.iterator():
+            rebuild_question_aggregates(survey)
+            invalidate_report_snapshot(survey)
+            rebuilt += 1
+        
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt aggregates for {rebuilt} surveys'))
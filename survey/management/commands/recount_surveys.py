@@ -0,0 +1,48 @@
+"""
+Management command to repair drift in the denormalized Survey counters.
+Usage: python manage.py recount_surveys [--survey ID] [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+
+from survey.models import Survey
+
+
+class Command(BaseCommand):
+    help = 'Recompute response and invitation counters on surveys from their related rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--survey',
+            type=int,
+            action='append',
+            dest='survey_ids',
+            help='Only recount the given survey ID (may be repeated)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted surveys without fixing them'
+        )
+
+    def handle(self, *args, **options):
+        surveys = Survey.objects.all()
+        if options['survey_ids']:
+            surveys = surveys.filter(id__in=options['survey_ids'])
+        
+        drifted = list(surveys.drifted())
+        for survey in drifted:
+            self.stdout.write(
+                f'Survey {survey.id} ({survey.leader_name}): '
+                f'responses {survey.response_count} -> {survey.actual_response_count}, '
+                f'invitations {survey.invitation_count} -> {survey.actual_invitation_count}, '
+                f'used {survey.used_invitation_count} -> {survey.actual_used_invitation_count}'
+            )
+        
+        if options['dry_run']:
+            self.stdout.write(f'{len(drifted)} surveys have drifted counters')
+            return
+        
+        if drifted:
+            Survey.objects.filter(id__in=[survey.id for survey in drifted]).recount()
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters for {len(drifted)} surveys'))
@@ -0,0 +1,142 @@
+"""
+Management command to deliver queued emails from the OutgoingEmail outbox.
+Usage: python manage.py send_queued_emails [--batch-size 50] [--loop] [--interval 5]
+
+Each batch is claimed in a short transaction that marks the emails 'sending'
+and counts the attempt; the SMTP conversation then runs outside any
+transaction. Claims older than --claim-timeout (a worker that died mid-batch)
+go back to 'pending', or to 'failed' once they are out of attempts.
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction, close_old_connections
+from django.db.models import Case, When, Value, F
+from django.utils import timezone
+
+from survey.models import OutgoingEmail
+from survey.utils import build_email_message
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails in batches over a single reused SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='Maximum number of emails to send per batch (default: 50)'
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=3,
+            help='Give up on an email after this many failed attempts (default: 3)'
+        )
+        parser.add_argument(
+            '--claim-timeout',
+            type=float,
+            default=600,
+            help='Seconds after which an unfinished claim is retried (default: 600)'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the outbox instead of exiting once it is drained'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Seconds to sleep between polls when --loop is set (default: 5)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        max_attempts = options['max_attempts']
+
+        claim_timeout = timedelta(seconds=options['claim_timeout'])
+
+        while True:
+            # Like a request boundary: drop the DB connection once it is past CONN_MAX_AGE or broken
+            close_old_connections()
+            self.release_stale_claims(claim_timeout, max_attempts)
+            claimed, sent, failed = self.send_batch(batch_size, max_attempts)
+            if claimed:
+                self.stdout.write(f'Sent {sent} emails, {failed} failed')
+
+            # A full batch means more mail may be waiting; otherwise the outbox is drained. If nothing
+            # could be sent (e.g. SMTP is down), wait for the next poll rather than retrying at once
+            if claimed == batch_size and sent:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Outbox drained'))
+
+    def release_stale_claims(self, claim_timeout, max_attempts):
+        """Return emails claimed longer than ``claim_timeout`` ago to the outbox."""
+        return OutgoingEmail.objects.filter(
+            status='sending', claimed_at__lt=timezone.now() - claim_timeout
+        ).update(
+            status=Case(When(attempts__gte=max_attempts, then=Value('failed')), default=Value('pending')),
+            last_error='Claim expired before the send finished',
+        )
+
+    def claim_batch(self, batch_size, max_attempts):
+        """Mark up to ``batch_size`` pending emails as 'sending' and count the attempt; return them."""
+        with transaction.atomic():
+            # skip_locked lets several workers claim from the outbox without double-sending
+            batch = list(
+                OutgoingEmail.objects.select_for_update(skip_locked=True)
+                .filter(status='pending', attempts__lt=max_attempts)
+                .order_by('created_at')[:batch_size]
+            )
+            if batch:
+                OutgoingEmail.objects.filter(pk__in=[outgoing_email.pk for outgoing_email in batch]).update(
+                    status='sending', claimed_at=timezone.now(), attempts=F('attempts') + 1
+                )
+        return batch
+
+    def mark_failed(self, batch, error, max_attempts):
+        """Record a failed attempt for the given claimed emails, giving up after ``max_attempts``."""
+        OutgoingEmail.objects.filter(pk__in=[outgoing_email.pk for outgoing_email in batch]).update(
+            last_error=str(error),
+            status=Case(When(attempts__gte=max_attempts, then=Value('failed')), default=Value('pending')),
+        )
+
+    def send_batch(self, batch_size, max_attempts):
+        """Claim and deliver one batch of pending emails; return (claimed, sent, failed)."""
+        batch = self.claim_batch(batch_size, max_attempts)
+        if not batch:
+            return 0, 0, 0
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            # SMTP is unreachable: the whole batch failed this attempt
+            self.mark_failed(batch, e, max_attempts)
+            return len(batch), 0, len(batch)
+
+        sent = 0
+        failed = 0
+        try:
+            for outgoing_email in batch:
+                try:
+                    connection.send_messages([build_email_message(outgoing_email, connection)])
+                except Exception as e:
+                    self.mark_failed([outgoing_email], e, max_attempts)
+                    failed += 1
+                else:
+                    OutgoingEmail.objects.filter(pk=outgoing_email.pk).update(status='sent', sent_at=timezone.now())
+                    sent += 1
+        finally:
+            connection.close()
+
+        return len(batch), sent, failed
@@ -59,6 +59,8 @@ class Command(BaseCommand):
                     expires_at=expires_at
                 )
             
+            Survey.objects.filter(pk=survey.pk).recount()
+            
             self.stdout.write(
                 self.style.SUCCESS(f'Created {len(demo_emails)} demo invitations')
             )
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surveyreport',
+            name='snapshot',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='surveyreport',
+            name='snapshot_built_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
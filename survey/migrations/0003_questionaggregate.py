@@ -0,0 +1,77 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+LIKERT_SCORES = {
+    'significantly_above': 7,
+    'above': 6,
+    'slightly_above': 5,
+    'meets': 4,
+    'slightly_below': 3,
+    'below': 2,
+    'significantly_below': 1,
+}
+
+
+def backfill_question_aggregates(apps, schema_editor):
+    """Fold existing responses into the new running aggregates."""
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    QuestionAggregate = apps.get_model('survey', 'QuestionAggregate')
+    
+    fields = [f'q{q_num}_response' for q_num in range(2, 56)]
+    totals = {}
+    rows = SurveyResponse.objects.values_list('survey_id', 'relationship', 'is_leader_self_assessment', *fields)
+    for survey_id, relationship, is_self, *answers in rows.iterator():
+        relationship = 'self' if is_self else relationship
+        for q_num, value in zip(range(2, 56), answers):
+            if not value:
+                continue
+            score = LIKERT_SCORES.get(value, 4)
+            total = totals.setdefault((survey_id, q_num, relationship), [0, 0, 0])
+            total[0] += score
+            total[1] += 1
+            total[2] += score * score
+    
+    QuestionAggregate.objects.bulk_create(
+        [
+            QuestionAggregate(
+                survey_id=survey_id,
+                question_no=q_num,
+                relationship=relationship,
+                score_total=score_total,
+                response_count=response_count,
+                score_squares=score_squares,
+            )
+            for (survey_id, q_num, relationship), (score_total, response_count, score_squares) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0002_surveyreport_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_no', models.PositiveSmallIntegerField()),
+                ('relationship', models.CharField(max_length=50)),
+                ('response_count', models.PositiveIntegerField(default=0)),
+                ('score_total', models.PositiveIntegerField(default=0)),
+                ('score_squares', models.PositiveIntegerField(default=0)),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_aggregates', to='survey.survey')),
+            ],
+            options={
+                'ordering': ['question_no', 'relationship'],
+                'unique_together': {('survey', 'question_no', 'relationship')},
+            },
+        ),
+        migrations.RunPython(backfill_question_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0004_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(fields=['-created_at', '-id'], name='survey_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(fields=['is_active', '-created_at', '-id'], name='survey_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(fields=['leader_completed_self', '-created_at', '-id'], name='survey_self_created_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:15
+
+from django.db import migrations
+from django.db.models import Case, When, Value, F
+
+
+LIKERT_SCORES = {
+    'significantly_above': 7,
+    'above': 6,
+    'slightly_above': 5,
+    'meets': 4,
+    'slightly_below': 3,
+    'below': 2,
+    'significantly_below': 1,
+}
+
+ANSWER_FIELDS = [f'q{q_num}_response' for q_num in range(2, 56)]
+
+
+def encode_answers(apps, schema_editor):
+    """Rewrite string answers as their score digits so the columns can be cast to integers.
+
+    Blank answers become '0' (cleared to NULL once the columns are integers),
+    digits already written by a previous run are kept, and any other value
+    falls back to '4' ('meets'). Every column is rewritten in one UPDATE.
+    """
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    digits = [str(score) for score in LIKERT_SCORES.values()]
+    SurveyResponse.objects.update(**{
+        field: Case(
+            When(**{field: ''}, then=Value('0')),
+            *[When(**{field: key}, then=Value(str(score))) for key, score in LIKERT_SCORES.items()],
+            When(**{f'{field}__in': ['0', *digits]}, then=F(field)),
+            default=Value('4'),
+        )
+        for field in ANSWER_FIELDS
+    })
+
+
+def decode_answers(apps, schema_editor):
+    """Turn score digits back into the original string keys, in one UPDATE."""
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    SurveyResponse.objects.update(**{
+        field: Case(
+            When(**{field: '0'}, then=Value('')),
+            *[When(**{field: str(score)}, then=Value(key)) for key, score in LIKERT_SCORES.items()],
+            default=F(field),
+        )
+        for field in ANSWER_FIELDS
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0005_survey_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_answers, decode_answers),
+    ]
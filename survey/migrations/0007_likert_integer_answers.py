@@ -0,0 +1,283 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0006_encode_likert_answers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q10_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q11_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q12_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q13_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q14_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q15_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q16_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q17_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q18_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q19_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q20_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q21_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q22_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q23_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q24_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q25_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q26_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q27_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q28_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q29_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q2_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q30_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q31_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q32_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q33_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q34_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q35_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q36_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q37_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q38_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q39_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q3_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q40_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q41_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q42_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q43_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q44_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q45_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q46_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q47_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q48_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q49_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q4_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q50_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q51_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q52_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q53_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q54_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q55_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q5_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q6_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q7_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q8_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='surveyresponse',
+            name='q9_response',
+            field=models.PositiveSmallIntegerField(choices=[(7, 'Significantly above expectations'), (6, 'Above expectations'), (5, 'Slightly above expectations'), (4, 'Meets expectations'), (3, 'Slightly below expectations'), (2, 'Below expectations'), (1, 'Significantly below expectations')], null=True),
+        ),
+    ]
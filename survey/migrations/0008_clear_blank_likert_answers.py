@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:15
+
+from django.db import migrations
+
+
+ANSWER_FIELDS = [f'q{q_num}_response' for q_num in range(2, 56)]
+
+
+def clear_blank_answers(apps, schema_editor):
+    """Blank answers were encoded as 0 for the cast; store them as NULL."""
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    for field in ANSWER_FIELDS:
+        SurveyResponse.objects.filter(**{field: 0}).update(**{field: None})
+
+
+def mark_blank_answers(apps, schema_editor):
+    """Reverse: encode NULL answers as 0 so the columns can be cast back to strings."""
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    for field in ANSWER_FIELDS:
+        SurveyResponse.objects.filter(**{f'{field}__isnull': True}).update(**{field: 0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0007_likert_integer_answers'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_blank_answers, mark_blank_answers),
+    ]
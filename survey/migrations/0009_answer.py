@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0008_clear_blank_likert_answers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Answer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_no', models.PositiveSmallIntegerField()),
+                ('relationship', models.CharField(max_length=50)),
+                ('score', models.PositiveSmallIntegerField()),
+                ('response', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='survey.surveyresponse')),
+                ('survey', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='survey.survey')),
+            ],
+            options={
+                'ordering': ['question_no'],
+                'indexes': [models.Index(fields=['survey', 'question_no'], include=('relationship', 'score'), name='answer_survey_question_idx'), models.Index(fields=['question_no', 'relationship'], include=('score',), name='answer_question_rel_idx')],
+                'unique_together': {('response', 'question_no')},
+            },
+        ),
+    ]
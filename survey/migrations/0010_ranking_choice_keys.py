@@ -0,0 +1,93 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:25
+
+from django.db import migrations
+
+
+STRENGTH_CHOICES = [
+    ('guide_others', 'Ability to guide others towards a common goal'),
+    ('oral_communication', 'Possesses excellent oral communication skills'),
+    ('written_communication', 'Possesses effective written communication skills'),
+    ('listener', 'Great listener'),
+    ('express_ideas', 'Expresses ideas clearly'),
+    ('teacher_development', 'Supports teacher professional development'),
+    ('instructional_strategies', 'Supports teachers in implementing effective instructional strategies'),
+    ('build_relationships', 'Ability to build positive relationships with others'),
+    ('collaboration', 'Supports collaboration among all school stakeholders'),
+    ('analyze_challenges', 'Ability to analyze challenges and implement solutions'),
+    ('positive_culture', 'Creates a positive school culture'),
+    ('innovation', 'Promotes and encourages innovation'),
+    ('continuous_improvement', 'Supports and encourages continuous improvement'),
+    ('timely_decisions', 'Makes timely decisions aligned with school mission and goals'),
+    ('inclusive_decisions', 'Decisions encompass the needs of all stakeholders'),
+    ('data_driven', 'Uses data to inform major decisions'),
+    ('manages_emotions', 'Effectively manages emotions'),
+    ('resilient', 'Resilient in effectively navigating change'),
+    ('navigate_challenges', 'Able to navigate challenges and obstacles'),
+    ('clear_vision', 'Has a clear vision for the school'),
+    ('motivate_others', 'Able to motivate others to work towards shared goals'),
+    ('integrity', 'Maintains a high level of integrity'),
+    ('positive_environment', 'Create a positive school environment'),
+    ('committed_learning', 'Committed to learning and growing professionally'),
+    ('research_practices', 'Is up to date on the latest research and best practices'),
+]
+
+OPPORTUNITY_CHOICES = [
+    ('lacks_vision', 'Lacks a clear vision for the school'),
+    ('verbal_communication', 'Struggles to verbally communicate ideas'),
+    ('written_communication', 'Struggles to communicate in written formats'),
+    ('low_morale', 'Leadership contributes to low morale'),
+    ('resistant_change', 'Resistant to change'),
+    ('foster_collaboration', 'Struggles to foster collaboration'),
+    ('lack_trust', 'Leadership promotes a lack of trust among others'),
+    ('address_issues', 'Struggles to address issues effectively'),
+    ('micromanages', 'Micromanages others'),
+    ('inhibits_autonomy', 'Inhibits autonomy and creativity'),
+    ('pd_opportunities', 'Provide more sufficient PD opportunities for all staff'),
+    ('positive_culture', 'Struggles to create a positive school culture'),
+    ('engage_parents', 'Improve skills to effectively engage parents or community'),
+    ('listening_skills', 'Needs to improve listening skills'),
+    ('expressing_ideas', 'Difficulty expressing ideas'),
+    ('delegate', 'Should delegate more effectively (distribution of tasks)'),
+    ('feedback_processes', 'Could improve their feedback processes'),
+    ('problem_solving', 'Could improve their problem solving skills'),
+    ('follow_through', 'Seems to not follow through'),
+    ('diverse_perspectives', 'Could improve their appreciation for diverse perspectives'),
+    ('recognize_others', 'Could recognize others more often'),
+]
+
+
+def _remap(apps, reverse):
+    StrengthRanking = apps.get_model('survey', 'StrengthRanking')
+    OpportunityRanking = apps.get_model('survey', 'OpportunityRanking')
+    SurveyReport = apps.get_model('survey', 'SurveyReport')
+    
+    for model, field, choices in [
+        (StrengthRanking, 'strength', STRENGTH_CHOICES),
+        (OpportunityRanking, 'opportunity', OPPORTUNITY_CHOICES),
+    ]:
+        for key, label in choices:
+            old, new = (key, label) if reverse else (label, key)
+            model.objects.filter(**{field: old}).update(**{field: new})
+    
+    # Cached report snapshots hold ranking values in the old format
+    SurveyReport.objects.update(snapshot=None, snapshot_built_at=None)
+
+
+def texts_to_keys(apps, schema_editor):
+    """Store rankings by choice key; values outside the choice list are left as they are."""
+    _remap(apps, reverse=False)
+
+
+def keys_to_texts(apps, schema_editor):
+    _remap(apps, reverse=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0009_answer'),
+    ]
+
+    operations = [
+        migrations.RunPython(texts_to_keys, keys_to_texts),
+    ]
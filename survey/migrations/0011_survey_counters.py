@@ -0,0 +1,54 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, IntegerField
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    """Fill the new counters from existing responses and invitations in one UPDATE."""
+    Survey = apps.get_model('survey', 'Survey')
+    SurveyResponse = apps.get_model('survey', 'SurveyResponse')
+    SurveyInvitation = apps.get_model('survey', 'SurveyInvitation')
+    
+    def count(model, **filters):
+        counts = (
+            model.objects.filter(survey=OuterRef('pk'), **filters)
+            .order_by()
+            .values('survey')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+    
+    Survey.objects.update(
+        response_count=count(SurveyResponse),
+        invitation_count=count(SurveyInvitation),
+        used_invitation_count=count(SurveyInvitation, used=True),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0010_ranking_choice_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='survey',
+            name='invitation_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='survey',
+            name='response_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='survey',
+            name='used_invitation_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0011_survey_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='outgoingemail',
+            name='survey_outg_status_440ee1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='outgoingemail',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['created_at'], name='outgoing_email_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyinvitation',
+            index=models.Index(fields=['survey', 'used', 'expires_at'], name='invitation_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyinvitation',
+            index=models.Index(fields=['survey', '-sent_at'], name='invitation_survey_sent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey', '-submitted_at'], name='response_survey_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey', 'relationship'], name='response_survey_rel_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(condition=models.Q(('is_leader_self_assessment', False)), fields=['survey'], name='response_participant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['submitted_at'], name='response_submitted_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0012_query_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surveyreport',
+            name='snapshot_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
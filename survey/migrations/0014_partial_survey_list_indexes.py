@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 16:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0013_surveyreport_snapshot_version'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='survey',
+            name='survey_active_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='survey',
+            name='survey_self_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='survey_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(condition=models.Q(('leader_completed_self', False)), fields=['-created_at', '-id'], name='survey_self_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='survey',
+            index=models.Index(condition=models.Q(('leader_completed_self', True)), fields=['-created_at', '-id'], name='survey_completed_created_idx'),
+        ),
+    ]
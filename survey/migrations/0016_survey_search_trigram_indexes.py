@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-16 18:40
+
+from django.db import migrations
+
+
+# The admin survey list searches these columns with icontains, which PostgreSQL
+# compiles to UPPER("column"::text) LIKE UPPER('%term%'). A leading wildcard
+# can't use a B-tree, but a trigram GIN index on the same UPPER() expression can.
+SEARCH_INDEXES = {
+    'survey_leader_name_trgm_idx': 'leader_name',
+    'survey_leader_email_trgm_idx': 'leader_email',
+    'survey_title_trgm_idx': 'title',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Add the trigram search indexes on PostgreSQL; other databases keep scanning."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # pg_trgm is a trusted extension, so the database owner can create it (PostgreSQL 13+)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    table = schema_editor.quote_name('survey_survey')
+    for index_name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX {schema_editor.quote_name(index_name)} ON {table} '
+            f'USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Reverse: drop the indexes but leave pg_trgm installed, other schemas may use it."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(index_name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0015_outgoingemail_claim'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
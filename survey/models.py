@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 import secrets
 import string
@@ -11,6 +12,44 @@ def generate_token(length=64):
     return ''.join(secrets.choice(alphabet) for _ in range(length))
 
 
+def _count_subquery(model, **filters):
+    """Correlated COUNT(*) of ``model`` rows belonging to the outer survey."""
+    counts = (
+        model.objects.filter(survey=models.OuterRef('pk'), **filters)
+        .order_by()
+        .values('survey')
+        .annotate(total=models.Count('id'))
+        .values('total')
+    )
+    return Coalesce(models.Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+class SurveyQuerySet(models.QuerySet):
+    def with_actual_counts(self):
+        """Annotate the counts the denormalized counters should hold, computed from related rows."""
+        return self.annotate(
+            actual_response_count=_count_subquery(SurveyResponse),
+            actual_invitation_count=_count_subquery(SurveyInvitation),
+            actual_used_invitation_count=_count_subquery(SurveyInvitation, used=True),
+        )
+    
+    def drifted(self):
+        """Surveys whose counters disagree with their related rows."""
+        return self.with_actual_counts().exclude(
+            response_count=models.F('actual_response_count'),
+            invitation_count=models.F('actual_invitation_count'),
+            used_invitation_count=models.F('actual_used_invitation_count'),
+        )
+    
+    def recount(self):
+        """Recompute the denormalized counters in a single UPDATE; returns the number of surveys."""
+        return self.update(
+            response_count=_count_subquery(SurveyResponse),
+            invitation_count=_count_subquery(SurveyInvitation),
+            used_invitation_count=_count_subquery(SurveyInvitation, used=True),
+        )
+
+
 class Survey(models.Model):
     """Main survey model representing a leadership assessment."""
     title = models.CharField(max_length=200)
@@ -23,24 +62,47 @@ class Survey(models.Model):
     leader_completed_self = models.BooleanField(default=False)
     leader_token = models.CharField(max_length=64, unique=True, default=generate_token)
     
+    # Denormalized counters, maintained with F() updates by survey.services (repair with recount_surveys)
+    response_count = models.PositiveIntegerField(default=0)
+    invitation_count = models.PositiveIntegerField(default=0)
+    used_invitation_count = models.PositiveIntegerField(default=0)
+    
+    objects = SurveyQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of the admin survey list, optionally filtered by status. The
+            # status filters are partial indexes: a bare boolean WHERE is not an indexable
+            # equality on SQLite, but does match a partial index's condition
+            models.Index(fields=['-created_at', '-id'], name='survey_created_idx'),
+            models.Index(
+                fields=['-created_at', '-id'], condition=models.Q(is_active=True), name='survey_active_created_idx'
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], condition=models.Q(leader_completed_self=False),
+                name='survey_self_created_idx',
+            ),
+            models.Index(
+                fields=['-created_at', '-id'], condition=models.Q(leader_completed_self=True),
+                name='survey_completed_created_idx',
+            ),
+        ]
         
     def __str__(self):
         return f"{self.title} - {self.leader_name}"
     
     def get_response_count(self):
-        return self.responses.exclude(is_leader_self_assessment=True).count()
+        # The leader's self-assessment is the only non-participant response
+        return max(self.response_count - int(self.leader_completed_self), 0)
     
     def get_total_response_count(self):
-        return self.responses.count()
+        return self.response_count
     
     def get_completion_rate(self):
-        invitations = self.invitations.count()
-        if invitations == 0:
+        if self.invitation_count == 0:
             return 0
-        completed = self.invitations.filter(used=True).count()
-        return (completed / invitations) * 100
+        return (self.used_invitation_count / self.invitation_count) * 100
 
 
 class SurveyInvitation(models.Model):
@@ -57,6 +119,12 @@ class SurveyInvitation(models.Model):
     class Meta:
         ordering = ['-sent_at']
         unique_together = ['survey', 'email']
+        indexes = [
+            # Invitation status counts on the survey detail page (index-only on used/expires_at)
+            models.Index(fields=['survey', 'used', 'expires_at'], name='invitation_status_idx'),
+            # Invitation tables on the survey detail and leader dashboard pages
+            models.Index(fields=['survey', '-sent_at'], name='invitation_survey_sent_idx'),
+        ]
         
     def __str__(self):
         return f"Invitation to {self.email} for {self.survey.leader_name}"
@@ -70,6 +138,41 @@ class SurveyInvitation(models.Model):
         return not self.used and not self.is_expired
 
 
+class OutgoingEmail(models.Model):
+    """Email queued for delivery by the send_queued_emails worker."""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    invitation = models.ForeignKey(SurveyInvitation, on_delete=models.CASCADE, null=True, blank=True, related_name='emails')
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # When a worker claimed the email for its current attempt (status 'sending')
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            # The outbox worker only scans pending rows; sent mail stays out of the index
+            models.Index(fields=['created_at'], condition=models.Q(status='pending'), name='outgoing_email_pending_idx'),
+            # Claims abandoned by a crashed worker are found by age
+            models.Index(fields=['claimed_at'], condition=models.Q(status='sending'), name='outgoing_email_sending_idx'),
+        ]
+        
+    def __str__(self):
+        return f"{self.subject} to {self.to_email} ({self.status})"
+
+
 class SurveyResponse(models.Model):
     """Individual response to a survey."""
     RELATIONSHIP_CHOICES = [
@@ -81,16 +184,27 @@ class SurveyResponse(models.Model):
         ('self', 'Self'),
     ]
     
+    # Answers are stored as their 1-7 score; LIKERT_KEYS maps back to the legacy string keys
     LIKERT_CHOICES = [
-        ('significantly_above', 'Significantly above expectations'),
-        ('above', 'Above expectations'),
-        ('slightly_above', 'Slightly above expectations'),
-        ('meets', 'Meets expectations'),
-        ('slightly_below', 'Slightly below expectations'),
-        ('below', 'Below expectations'),
-        ('significantly_below', 'Significantly below expectations'),
+        (7, 'Significantly above expectations'),
+        (6, 'Above expectations'),
+        (5, 'Slightly above expectations'),
+        (4, 'Meets expectations'),
+        (3, 'Slightly below expectations'),
+        (2, 'Below expectations'),
+        (1, 'Significantly below expectations'),
     ]
     
+    LIKERT_KEYS = {
+        7: 'significantly_above',
+        6: 'above',
+        5: 'slightly_above',
+        4: 'meets',
+        3: 'slightly_below',
+        2: 'below',
+        1: 'significantly_below',
+    }
+    
     survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='responses')
     invitation = models.ForeignKey(SurveyInvitation, on_delete=models.CASCADE, null=True, blank=True, related_name='response')
     relationship = models.CharField(max_length=50, choices=RELATIONSHIP_CHOICES)
@@ -98,60 +212,60 @@ class SurveyResponse(models.Model):
     is_leader_self_assessment = models.BooleanField(default=False)
     
     # Questions 2-55 (Leadership evaluation questions)
-    q2_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q3_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q4_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q5_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q6_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q7_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q8_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q9_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q10_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q11_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q12_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q13_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q14_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q15_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q16_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q17_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q18_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q19_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q20_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q21_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q22_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q23_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q24_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q25_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q26_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q27_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q28_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q29_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q30_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q31_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q32_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q33_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q34_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q35_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q36_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q37_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q38_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q39_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q40_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q41_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q42_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q43_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q44_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q45_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q46_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q47_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q48_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q49_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q50_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q51_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q52_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q53_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q54_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
-    q55_response = models.CharField(max_length=50, choices=LIKERT_CHOICES)
+    q2_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q3_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q4_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q5_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q6_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q7_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q8_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q9_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q10_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q11_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q12_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q13_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q14_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q15_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q16_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q17_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q18_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q19_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q20_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q21_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q22_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q23_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q24_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q25_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q26_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q27_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q28_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q29_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q30_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q31_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q32_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q33_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q34_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q35_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q36_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q37_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q38_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q39_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q40_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q41_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q42_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q43_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q44_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q45_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q46_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q47_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q48_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q49_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q50_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q51_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q52_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q53_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q54_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
+    q55_response = models.PositiveSmallIntegerField(choices=LIKERT_CHOICES, null=True)
     
     # Open-ended responses (Questions 58-60)
     continue_doing = models.TextField(blank=True, verbose_name="What should this leader CONTINUE doing?")
@@ -160,9 +274,65 @@ class SurveyResponse(models.Model):
     
     class Meta:
         ordering = ['-submitted_at']
+        indexes = [
+            # Response table on the survey detail page
+            models.Index(fields=['survey', '-submitted_at'], name='response_survey_submitted_idx'),
+            # Per-relationship counts in reports
+            models.Index(fields=['survey', 'relationship'], name='response_survey_rel_idx'),
+            # Participant counts skip the self-assessment without touching the table
+            models.Index(
+                fields=['survey'],
+                condition=models.Q(is_leader_self_assessment=False),
+                name='response_participant_idx',
+            ),
+            # "Responses today" on the admin dashboard
+            models.Index(fields=['submitted_at'], name='response_submitted_idx'),
+        ]
         
     def __str__(self):
         return f"Response for {self.survey.leader_name} by {self.relationship}"
+    
+    def get_answer_key(self, q_num):
+        """Legacy string key ('above', 'meets', ...) for a question's answer, '' when blank."""
+        return self.LIKERT_KEYS.get(getattr(self, f'q{q_num}_response'), '')
+
+
+class QuestionAggregate(models.Model):
+    """Running score totals for one question and relationship within a survey."""
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='question_aggregates')
+    question_no = models.PositiveSmallIntegerField()
+    relationship = models.CharField(max_length=50)  # 'self' for leader self-assessments
+    response_count = models.PositiveIntegerField(default=0)
+    score_total = models.PositiveIntegerField(default=0)
+    score_squares = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        ordering = ['question_no', 'relationship']
+        unique_together = ['survey', 'question_no', 'relationship']
+        
+    def __str__(self):
+        return f"Q{self.question_no} ({self.relationship}) for {self.survey.leader_name}"
+
+
+class Answer(models.Model):
+    """A single Likert answer in long format: one row per response and question."""
+    response = models.ForeignKey(SurveyResponse, on_delete=models.CASCADE, related_name='answers')
+    survey = models.ForeignKey(Survey, on_delete=models.CASCADE, related_name='answers')
+    question_no = models.PositiveSmallIntegerField()
+    relationship = models.CharField(max_length=50)  # 'self' for leader self-assessments
+    score = models.PositiveSmallIntegerField()
+    
+    class Meta:
+        ordering = ['question_no']
+        unique_together = ['response', 'question_no']
+        indexes = [
+            # Covering indexes (INCLUDE is applied on PostgreSQL only) for per-survey and cross-survey GROUP BYs
+            models.Index(fields=['survey', 'question_no'], include=['relationship', 'score'], name='answer_survey_question_idx'),
+            models.Index(fields=['question_no', 'relationship'], include=['score'], name='answer_question_rel_idx'),
+        ]
+        
+    def __str__(self):
+        return f"Q{self.question_no}={self.score} ({self.relationship})"
 
 
 class StrengthRanking(models.Model):
@@ -254,6 +424,12 @@ class SurveyReport(models.Model):
     sent_to_leader = models.BooleanField(default=False)
     sent_at = models.DateTimeField(null=True, blank=True)
     
+    # Materialized report context; cleared whenever a new response arrives
+    snapshot = models.JSONField(null=True, blank=True)
+    snapshot_built_at = models.DateTimeField(null=True, blank=True)
+    # Bumped on every invalidation so a rebuild that raced one is not stored
+    snapshot_version = models.PositiveIntegerField(default=0)
+    
     class Meta:
         ordering = ['-generated_at']
         
@@ -264,4 +440,4 @@ class SurveyReport(models.Model):
         """Mark the report as sent to the leader."""
         self.sent_to_leader = True
         self.sent_at = timezone.now()
-        self.save()
\ No newline at end of file
+        self.save(update_fields=['sent_to_leader', 'sent_at'])
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""Report aggregation engine for the survey application."""
+
+import math
+
+from asgiref.sync import sync_to_async
+from django.db.models import F, Sum, Count
+from django.utils import timezone
+
+from .models import SurveyResponse, StrengthRanking, OpportunityRanking, SurveyReport
+from .aggregates import QUESTION_NUMBERS
+from .stats_backends import get_question_totals, get_score_distributions
+from .utils import get_question_texts
+
+
+REPORT_RELATIONSHIPS = ['self', 'supervisor', 'peer', 'teacher', 'student', 'parent']
+
+
+def build_question_stats(totals, distributions=None):
+    """Build the template's question_stats dict and overall average from grouped totals.
+
+    ``distributions`` ({q_num: counts per score}) is added to each question's
+    stats as ``distribution`` when given.
+    """
+    question_stats = {}
+    question_texts = get_question_texts()
+    grand_sum = 0
+    grand_count = 0
+
+    for q_num in QUESTION_NUMBERS:
+        q_sum = 0
+        q_count = 0
+        q_squares = 0
+        avg_by_relationship = {rel: None for rel in REPORT_RELATIONSHIPS}
+
+        for relationship, (rel_sum, rel_count, rel_squares) in totals.get(q_num, {}).items():
+            q_sum += rel_sum
+            q_count += rel_count
+            q_squares += rel_squares
+            if relationship in avg_by_relationship:
+                avg_by_relationship[relationship] = round(rel_sum / rel_count, 2)
+
+        if q_count:
+            mean = q_sum / q_count
+            question_stats[q_num] = {
+                'text': question_texts[q_num],
+                'average': round(mean, 2),
+                'std_dev': round(math.sqrt(max(q_squares / q_count - mean * mean, 0)), 2),
+                'response_count': q_count,
+                'by_relationship': avg_by_relationship,
+            }
+            if distributions is not None:
+                question_stats[q_num]['distribution'] = distributions[q_num]
+            grand_sum += q_sum
+            grand_count += q_count
+
+    overall_average = round(grand_sum / grand_count, 2) if grand_count else 0
+    return question_stats, overall_average
+
+
+def get_ranking_totals(model, field_name, survey):
+    """Return [(choice_key, avg_rank, count)] sorted by average rank, highest first."""
+    rows = (
+        model.objects.filter(response__survey=survey)
+        .order_by()
+        .values(field_name)
+        .annotate(rank_total=Sum('rank'), rank_count=Count('id'))
+    )
+    rankings = [(row[field_name], row['rank_total'] / row['rank_count'], row['rank_count']) for row in rows]
+    rankings.sort(key=lambda x: x[1], reverse=True)
+    return rankings
+
+
+def resolve_ranking_labels(rankings, choices):
+    """Swap choice keys for their display labels; unknown legacy values are shown as stored."""
+    labels = dict(choices)
+    return [(labels.get(key, key), avg_rank, count) for key, avg_rank, count in rankings]
+
+
+def get_relationship_counts(survey):
+    """Return {relationship: response count} in one grouped query."""
+    rows = (
+        SurveyResponse.objects.filter(survey=survey)
+        .order_by()
+        .values('relationship')
+        .annotate(total=Count('id'))
+    )
+    return {row['relationship']: row['total'] for row in rows}
+
+
+def build_report_context(survey):
+    """Compute every statistic rendered by reports/web_report.html."""
+    question_stats, overall_average = build_question_stats(
+        get_question_totals(survey), get_score_distributions(survey)
+    )
+
+    top_strengths = get_ranking_totals(StrengthRanking, 'strength', survey)
+    top_opportunities = get_ranking_totals(OpportunityRanking, 'opportunity', survey)
+
+    # Open-ended responses
+    continue_responses = []
+    stop_responses = []
+    start_responses = []
+    open_ended = survey.responses.values_list('continue_doing', 'stop_doing', 'start_doing')
+    for continue_doing, stop_doing, start_doing in open_ended:
+        if continue_doing:
+            continue_responses.append(continue_doing)
+        if stop_doing:
+            stop_responses.append(stop_doing)
+        if start_doing:
+            start_responses.append(start_doing)
+
+    relationship_counts = get_relationship_counts(survey)
+    participant_count = survey.responses.filter(is_leader_self_assessment=False).count()
+
+    return {
+        'response_count': sum(relationship_counts.values()),
+        'participant_count': participant_count,
+        'overall_average': overall_average,
+        'question_stats': question_stats,
+        'top_strengths': top_strengths[:10],
+        'top_opportunities': top_opportunities[:10],
+        'continue_responses': continue_responses,
+        'stop_responses': stop_responses,
+        'start_responses': start_responses,
+        'supervisors_count': relationship_counts.get('supervisor', 0),
+        'peers_count': relationship_counts.get('peer', 0),
+        'staff_count': relationship_counts.get('teacher', 0),
+        'students_count': relationship_counts.get('student', 0),
+        'community_count': relationship_counts.get('parent', 0),
+    }
+
+
+def refresh_report_snapshot(report):
+    """Recompute the report context and persist it on the SurveyReport.
+
+    The snapshot is only stored if the report's snapshot_version is unchanged,
+    i.e. no response invalidated it while the context was being built; the
+    computed context is returned either way.
+    """
+    version = report.snapshot_version
+    context = build_report_context(report.survey)
+    built_at = timezone.now()
+    stored = SurveyReport.objects.filter(pk=report.pk, snapshot_version=version).update(
+        snapshot=context, snapshot_built_at=built_at
+    )
+    if stored:
+        report.snapshot = context
+        report.snapshot_built_at = built_at
+    return context
+
+
+async def aget_report_context(report):
+    """Return the render-ready report context, rebuilding the snapshot only when it was invalidated.
+
+    A fresh snapshot needs no further queries, so this only leaves the event
+    loop when a rebuild is needed.
+    """
+    snapshot = report.snapshot
+    if snapshot is None:
+        # The rebuild runs many aggregate queries; keep them together in one sync call
+        snapshot = await sync_to_async(refresh_report_snapshot)(report)
+    return snapshot_to_context(snapshot)
+
+
+def snapshot_to_context(snapshot):
+    """Turn a stored report snapshot into the template context."""
+    context = dict(snapshot)
+    # JSON object keys are strings; the template compares question numbers as ints
+    context['question_stats'] = {int(q_num): stats for q_num, stats in context['question_stats'].items()}
+    # Snapshots store ranking choice keys; labels are resolved only for rendering
+    context['top_strengths'] = resolve_ranking_labels(context['top_strengths'], StrengthRanking.STRENGTH_CHOICES)
+    context['top_opportunities'] = resolve_ranking_labels(
+        context['top_opportunities'], OpportunityRanking.OPPORTUNITY_CHOICES
+    )
+    return context
+
+
+def invalidate_report_snapshot(survey):
+    """Drop the stored report snapshot after a new response lands for the survey.
+
+    Always bumps snapshot_version, even when no snapshot is stored, so that a
+    rebuild already in progress does not store a context that misses the response.
+    """
+    SurveyReport.objects.filter(survey=survey).update(
+        snapshot=None, snapshot_built_at=None, snapshot_version=F('snapshot_version') + 1
+    )
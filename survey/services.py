@@ -0,0 +1,123 @@
+"""Write-side services for the survey application."""
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Survey, SurveyInvitation, StrengthRanking, OpportunityRanking
+from .aggregates import record_response_aggregates
+from .answers import record_response_answers
+from .reports import invalidate_report_snapshot
+from .utils import queue_survey_invitations
+
+
+STRENGTH_KEYS = [key for key, _ in StrengthRanking.STRENGTH_CHOICES]
+OPPORTUNITY_KEYS = [key for key, _ in OpportunityRanking.OPPORTUNITY_CHOICES]
+
+
+class InvitationAlreadyUsed(Exception):
+    """Raised when an invitation was used by another submission in the meantime."""
+
+
+def collect_rankings(selected_ids, keys, post_data, prefix):
+    """Turn selected choice indexes into [(choice_key, rank)] using the posted rank fields."""
+    rankings = []
+    for i, choice_id in enumerate(selected_ids):
+        rank = post_data.get(f'{prefix}_rank_{choice_id}', 5-i)
+        rankings.append((keys[int(choice_id)], int(rank)))
+    return rankings
+
+
+def resolve_ranking_key(choices, value):
+    """Return the choice key for ``value``, given either the key or its display label."""
+    for key, label in choices:
+        if value == key or value == label:
+            return key
+    raise ValueError(f'Unknown ranking choice: {value!r}')
+
+
+def submit_survey_response(response, strengths, opportunities, invitation=None):
+    """Persist a survey response, its rankings and the resulting status changes.
+
+    ``response`` is an unsaved SurveyResponse with its survey set; ``strengths``
+    and ``opportunities`` are lists of (choice_key, rank). Everything is written
+    in one transaction with a fixed number of statements, independent of the
+    number of rankings. Participant submissions first claim ``invitation`` with
+    a conditional UPDATE and raise InvitationAlreadyUsed, rolling everything
+    back, if a concurrent submission got there first; leader self-assessments
+    (no invitation) mark the survey as self-assessed. The survey's counters are
+    then bumped in SQL before anything else is written; that UPDATE locks the
+    survey row, the same lock rebuild_question_aggregates takes, so a
+    rebuild never misses or double-counts this response. The in-memory
+    ``survey`` keeps its old counts until refreshed.
+    """
+    survey = response.survey
+    now = timezone.now()
+
+    with transaction.atomic():
+        if invitation is not None:
+            claimed = SurveyInvitation.objects.filter(pk=invitation.pk, used=False).update(used=True, used_at=now)
+            if not claimed:
+                raise InvitationAlreadyUsed('Survey already completed')
+            invitation.used = True
+            invitation.used_at = now
+            Survey.objects.filter(pk=survey.pk).update(
+                response_count=F('response_count') + 1,
+                used_invitation_count=F('used_invitation_count') + 1,
+            )
+        else:
+            Survey.objects.filter(pk=survey.pk).update(
+                leader_completed_self=True, updated_at=now, response_count=F('response_count') + 1
+            )
+            survey.leader_completed_self = True
+            survey.updated_at = now
+
+        response.save()
+        StrengthRanking.objects.bulk_create([
+            StrengthRanking(response=response, strength=strength, rank=rank)
+            for strength, rank in strengths
+        ])
+        OpportunityRanking.objects.bulk_create([
+            OpportunityRanking(response=response, opportunity=opportunity, rank=rank)
+            for opportunity, rank in opportunities
+        ])
+        record_response_aggregates(response)
+        record_response_answers(response)
+
+        invalidate_report_snapshot(survey)
+
+    return response
+
+
+def create_invitations(survey, emails, expires_at, request=None):
+    """Create invitations for any new addresses and queue their emails.
+
+    Uses a constant number of queries however many addresses are pasted:
+    one lookup of existing emails, one bulk INSERT (ignoring unique conflicts
+    from concurrent submissions), one fetch of the inserted rows, one bulk
+    INSERT into the email outbox and one counter UPDATE. Returns the newly created invitations.
+    """
+    unique_emails = list(dict.fromkeys(emails))
+    existing = set(
+        SurveyInvitation.objects.filter(survey=survey, email__in=unique_emails)
+        .values_list('email', flat=True)
+    )
+    pending = [
+        SurveyInvitation(survey=survey, email=email, expires_at=expires_at)
+        for email in unique_emails if email not in existing
+    ]
+    if not pending:
+        return []
+
+    with transaction.atomic():
+        SurveyInvitation.objects.bulk_create(pending, ignore_conflicts=True)
+        # ignore_conflicts leaves primary keys unset; tokens identify the rows we inserted
+        invitations = list(
+            SurveyInvitation.objects.filter(token__in=[invitation.token for invitation in pending])
+        )
+        for invitation in invitations:
+            invitation.survey = survey
+        queue_survey_invitations(invitations, request)
+        Survey.objects.filter(pk=survey.pk).update(invitation_count=F('invitation_count') + len(invitations))
+
+    return invitations
@@ -0,0 +1,17 @@
+"""Signal handlers for the survey application."""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .dashboard import invalidate_dashboard_stats
+from .models import Survey, SurveyResponse
+
+
+@receiver(post_save, sender=Survey)
+@receiver(post_delete, sender=Survey)
+@receiver(post_save, sender=SurveyResponse)
+@receiver(post_delete, sender=SurveyResponse)
+def survey_data_changed(sender, **kwargs):
+    """Invalidate cached dashboard totals once the surrounding transaction commits."""
+    transaction.on_commit(invalidate_dashboard_stats)
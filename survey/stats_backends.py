@@ -0,0 +1,174 @@
+"""Selectable computation backends for per-question report totals.
+
+Every backend returns {q_num: {relationship: (sum, count, squares)}} so the
+report engine can switch between them without changing its output:
+
+- ``aggregates``: reads the running QuestionAggregate rows (default)
+- ``numpy``: loads answers as a responses x questions int8 matrix and reduces
+  it with vectorized operations; optional, as numpy is not in requirements.txt
+- ``answers``: one GROUP BY over the long-format Answer rows; needs
+  RECORD_LONG_FORMAT_ANSWERS (and a backfill_answers run for older responses)
+- ``python``: plain per-response loops, kept as the reference implementation
+
+Per-question score distributions (get_score_distributions) come from the same
+score matrix with np.bincount when numpy is installed, and from a plain count
+otherwise.
+"""
+
+import importlib.util
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .aggregates import QUESTION_NUMBERS, load_question_totals
+from .answers import answers_enabled, answer_question_totals
+from .models import SurveyResponse
+
+
+ANSWER_FIELDS = [f'q{q_num}_response' for q_num in QUESTION_NUMBERS]
+MAX_SCORE = max(score for score, _ in SurveyResponse.LIKERT_CHOICES)
+
+
+def _answer_rows(survey):
+    return SurveyResponse.objects.filter(survey=survey).order_by().values_list(
+        'relationship', 'is_leader_self_assessment', *ANSWER_FIELDS
+    )
+
+
+def python_question_totals(survey):
+    """Reference implementation: one Python pass over every answer."""
+    totals = {q_num: {} for q_num in QUESTION_NUMBERS}
+    for relationship, is_self, *answers in _answer_rows(survey):
+        relationship = 'self' if is_self else relationship
+        for q_num, score in zip(QUESTION_NUMBERS, answers):
+            if not score:
+                continue
+            score_total, response_count, score_squares = totals[q_num].get(relationship, (0, 0, 0))
+            totals[q_num][relationship] = (score_total + score, response_count + 1, score_squares + score * score)
+    return totals
+
+
+def load_score_matrix(survey):
+    """Return (scores, relationship_codes, relationships) for a survey.
+
+    ``scores`` is a responses x questions int8 matrix with 0 for blank answers;
+    ``relationship_codes`` indexes into ``relationships`` for each response.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImproperlyConfigured("The 'numpy' report statistics backend requires numpy to be installed.")
+
+    rows = list(_answer_rows(survey))
+    if not rows:
+        return np.zeros((0, len(ANSWER_FIELDS)), dtype=np.int8), np.zeros(0, dtype=np.intp), []
+
+    # Blank (NULL) answers load as NaN and become 0
+    raw = np.array([answers for _, _, *answers in rows], dtype=np.float64)
+    scores = np.nan_to_num(raw).astype(np.int8)
+
+    report_relationships = np.array(['self' if is_self else relationship for relationship, is_self, *_ in rows])
+    relationships, relationship_codes = np.unique(report_relationships, return_inverse=True)
+    return scores, relationship_codes, relationships.tolist()
+
+
+def numpy_question_totals(survey):
+    """Vectorized implementation over the int8 score matrix."""
+    import numpy as np
+
+    scores, relationship_codes, relationships = load_score_matrix(survey)
+    totals = {q_num: {} for q_num in QUESTION_NUMBERS}
+    if not relationships:
+        return totals
+
+    # One-hot relationship membership lets each statistic be a single matrix product
+    membership = np.zeros((len(relationships), len(relationship_codes)), dtype=np.int64)
+    membership[relationship_codes, np.arange(len(relationship_codes))] = 1
+
+    wide = scores.astype(np.int64)
+    sums = membership @ wide
+    counts = membership @ (wide > 0).astype(np.int64)
+    squares = membership @ (wide * wide)
+
+    for rel_index, relationship in enumerate(relationships):
+        for col, q_num in enumerate(QUESTION_NUMBERS):
+            response_count = int(counts[rel_index, col])
+            if response_count:
+                totals[q_num][relationship] = (
+                    int(sums[rel_index, col]), response_count, int(squares[rel_index, col])
+                )
+    return totals
+
+
+def python_score_distributions(survey):
+    """Reference implementation of get_score_distributions."""
+    distributions = {q_num: [0] * MAX_SCORE for q_num in QUESTION_NUMBERS}
+    for _, _, *answers in _answer_rows(survey):
+        for q_num, score in zip(QUESTION_NUMBERS, answers):
+            if score:
+                distributions[q_num][score - 1] += 1
+    return distributions
+
+
+def numpy_score_distributions(survey):
+    """Histogram every question at once with a single np.bincount over the score matrix."""
+    import numpy as np
+
+    scores, _, _ = load_score_matrix(survey)
+    # Give each question its own block of MAX_SCORE + 1 bins (bin 0 collects blanks)
+    bins = MAX_SCORE + 1
+    offsets = np.arange(len(QUESTION_NUMBERS)) * bins
+    counts = np.bincount((scores.astype(np.intp) + offsets).ravel(), minlength=len(QUESTION_NUMBERS) * bins)
+    counts = counts.reshape(len(QUESTION_NUMBERS), bins)[:, 1:]
+    return {q_num: counts[col].tolist() for col, q_num in enumerate(QUESTION_NUMBERS)}
+
+
+def get_score_distributions(survey):
+    """Return {q_num: [responses scoring 1, ..., responses scoring MAX_SCORE]}."""
+    if is_backend_available('numpy'):
+        return numpy_score_distributions(survey)
+    return python_score_distributions(survey)
+
+
+STATS_BACKENDS = {
+    'aggregates': load_question_totals,
+    'numpy': numpy_question_totals,
+    'answers': answer_question_totals,
+    'python': python_question_totals,
+}
+
+
+# Backends that need a package outside requirements.txt
+OPTIONAL_BACKEND_MODULES = {
+    'numpy': 'numpy',
+}
+
+
+def backend_unavailable_reason(backend):
+    """Why ``backend`` cannot give correct totals in this deployment, or None if it can."""
+    module = OPTIONAL_BACKEND_MODULES.get(backend)
+    if module is not None and importlib.util.find_spec(module) is None:
+        return f'{module} is not installed'
+    if backend == 'answers' and not answers_enabled():
+        return 'RECORD_LONG_FORMAT_ANSWERS is off, so no Answer rows are recorded'
+    return None
+
+
+def is_backend_available(backend):
+    """Whether ``backend`` can run here (see backend_unavailable_reason)."""
+    return backend_unavailable_reason(backend) is None
+
+
+def get_question_totals(survey, backend=None):
+    """Compute per-question totals with the configured (or given) backend."""
+    backend = backend or getattr(settings, 'REPORT_STATS_BACKEND', 'aggregates')
+    try:
+        compute = STATS_BACKENDS[backend]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown REPORT_STATS_BACKEND {backend!r}; choose one of {', '.join(STATS_BACKENDS)}."
+        )
+    reason = backend_unavailable_reason(backend)
+    if reason:
+        raise ImproperlyConfigured(f'The {backend!r} report statistics backend is unavailable: {reason}.')
+    return compute(survey)
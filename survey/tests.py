@@ -0,0 +1,215 @@
+"""Tests for the survey application."""
+
+import io
+import json
+import random
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from survey.factories import get_staff_user, seed_survey, create_open_invitations, api_payload, form_payload
+from survey.models import Survey, SurveyInvitation, SurveyResponse, SurveyReport, QuestionAggregate, OutgoingEmail
+from survey import reports
+from survey.stats_backends import (
+    STATS_BACKENDS, get_question_totals, is_backend_available, numpy_score_distributions, python_score_distributions
+)
+from survey.services import submit_survey_response, InvitationAlreadyUsed
+from survey.aggregates import compute_question_totals, load_question_totals
+from survey.utils import parse_likert_answer
+
+
+class LikertAnswerTests(TestCase):
+    def test_accepts_scores_and_legacy_keys(self):
+        self.assertEqual(parse_likert_answer(7), 7)
+        self.assertEqual(parse_likert_answer('1'), 1)
+        self.assertEqual(parse_likert_answer('above'), 6)
+        self.assertIsNone(parse_likert_answer(''))
+
+    def test_rejects_invalid_answers(self):
+        for value in (0, 8, 99, '99', '-3', True, False, 4.5, 'unknown'):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_likert_answer(value)
+
+    def test_api_rejects_out_of_range_answer(self):
+        survey = seed_survey(get_staff_user(), 3, rng=random.Random(1))
+        invitation = create_open_invitations(survey, 1)[0]
+        aggregates_before = list(QuestionAggregate.objects.filter(survey=survey).order_by('pk').values())
+        payload = json.loads(api_payload(invitation.token))
+        payload['q5'] = 99
+
+        response = self.client.post(
+            reverse('api_submit', args=[invitation.token]), json.dumps(payload), content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(SurveyResponse.objects.filter(invitation=invitation).exists())
+        self.assertEqual(list(QuestionAggregate.objects.filter(survey=survey).order_by('pk').values()), aggregates_before)
+
+
+class QuestionAggregateTests(TestCase):
+    def test_load_without_aggregates_does_not_write(self):
+        survey = seed_survey(get_staff_user(), 5, rng=random.Random(2))
+        QuestionAggregate.objects.filter(survey=survey).delete()
+
+        with self.assertNumQueries(3):
+            totals = load_question_totals(survey)
+
+        self.assertEqual(totals, compute_question_totals(survey))
+        self.assertFalse(QuestionAggregate.objects.filter(survey=survey).exists())
+
+
+class SubmitSurveyResponseTests(TestCase):
+    def setUp(self):
+        self.survey = seed_survey(get_staff_user(), 2, rng=random.Random(3))
+        self.invitation = create_open_invitations(self.survey, 1)[0]
+
+    def test_invitation_used_concurrently_rolls_back(self):
+        # Another request marks the invitation used after this one loaded it
+        SurveyInvitation.objects.filter(pk=self.invitation.pk).update(used=True)
+        response = SurveyResponse(survey=self.survey, invitation=self.invitation, relationship='teacher', q2_response=5)
+
+        with self.assertRaises(InvitationAlreadyUsed):
+            submit_survey_response(response, [], [], invitation=self.invitation)
+
+        self.assertFalse(SurveyResponse.objects.filter(invitation=self.invitation).exists())
+        self.assertEqual(Survey.objects.get(pk=self.survey.pk).response_count, self.survey.response_count)
+
+    def test_api_reports_invitation_used_concurrently(self):
+        token = self.invitation.token
+        with mock.patch('survey.views.submit_survey_response', side_effect=InvitationAlreadyUsed('Survey already completed')):
+            response = self.client.post(reverse('api_submit', args=[token]), api_payload(token), content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Survey already completed'})
+
+    def test_participant_view_reports_invitation_used_concurrently(self):
+        token = self.invitation.token
+        with mock.patch('survey.views.submit_survey_response', side_effect=InvitationAlreadyUsed('Survey already completed')):
+            response = self.client.post(reverse('participant_survey', args=[token]), form_payload())
+
+        self.assertTemplateUsed(response, 'survey/invalid_link.html')
+
+
+class ReportSnapshotTests(TestCase):
+    def setUp(self):
+        self.survey = seed_survey(get_staff_user(), 3, rng=random.Random(4))
+        self.report = SurveyReport.objects.get(survey=self.survey)
+
+    def test_refresh_stores_snapshot(self):
+        context = reports.refresh_report_snapshot(self.report)
+
+        self.report.refresh_from_db()
+        self.assertIsNotNone(self.report.snapshot)
+        self.assertEqual(self.report.snapshot['response_count'], context['response_count'])
+
+    def test_invalidation_during_rebuild_is_not_overwritten(self):
+        build_report_context = reports.build_report_context
+
+        def build_then_invalidate(survey):
+            context = build_report_context(survey)
+            # A response lands after the rebuild has read the data
+            reports.invalidate_report_snapshot(survey)
+            return context
+
+        with mock.patch('survey.reports.build_report_context', side_effect=build_then_invalidate):
+            context = async_to_sync(reports.aget_report_context)(self.report)
+
+        self.assertEqual(context['response_count'], 4)
+        self.report.refresh_from_db()
+        self.assertIsNone(self.report.snapshot)
+        self.assertEqual(self.report.snapshot_version, 1)
+
+
+class StatsBackendTests(TestCase):
+    @override_settings(RECORD_LONG_FORMAT_ANSWERS=True)
+    def test_backends_agree(self):
+        survey = seed_survey(get_staff_user(), 25, rng=random.Random(5))
+        # One more through the API, with a blank answer, so the running aggregates are exercised too
+        invitation = create_open_invitations(survey, 1)[0]
+        payload = json.loads(api_payload(invitation.token))
+        payload['q7'] = ''
+        response = self.client.post(
+            reverse('api_submit', args=[invitation.token]), json.dumps(payload), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        expected = get_question_totals(survey, backend='python')
+        for backend in STATS_BACKENDS:
+            with self.subTest(backend=backend):
+                if not is_backend_available(backend):
+                    self.skipTest(f'{backend} backend needs an optional package')
+                self.assertEqual(get_question_totals(survey, backend=backend), expected)
+
+    def test_score_distributions(self):
+        survey = seed_survey(get_staff_user(), 25, rng=random.Random(8))
+        expected = python_score_distributions(survey)
+
+        totals = get_question_totals(survey, backend='python')
+        for q_num, counts in expected.items():
+            self.assertEqual(len(counts), 7)
+            self.assertEqual(sum(counts), sum(count for _, count, _ in totals[q_num].values()))
+        if is_backend_available('numpy'):
+            self.assertEqual(numpy_score_distributions(survey), expected)
+
+
+class LeaderDashboardTests(TestCase):
+    def test_invitations_are_paginated(self):
+        survey = seed_survey(get_staff_user(), 30, rng=random.Random(6))
+        url = reverse('leader_dashboard', args=[survey.leader_token])
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(len(response.context['invitations']), 25)
+        self.assertEqual(response.context['invitations'].paginator.num_pages, 2)
+
+        response = self.client.get(url, {'page': 2})
+        self.assertEqual(len(response.context['invitations']), 5)
+
+
+class SendQueuedEmailsTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            OutgoingEmail.objects.create(to_email=f'rater{i}@example.com', subject='Survey', body='Please respond')
+
+    def test_sends_pending_emails(self):
+        call_command('send_queued_emails', stdout=io.StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(set(OutgoingEmail.objects.values_list('status', 'attempts')), {('sent', 1)})
+
+    def test_unreachable_smtp_fails_the_batch_without_crashing(self):
+        connection = mock.Mock(**{'open.side_effect': OSError('Connection refused')})
+        with mock.patch(
+            'survey.management.commands.send_queued_emails.get_connection', return_value=connection
+        ):
+            call_command('send_queued_emails', stdout=io.StringIO())
+            self.assertEqual(set(OutgoingEmail.objects.values_list('status', 'attempts')), {('pending', 1)})
+            call_command('send_queued_emails', '--max-attempts', '2', stdout=io.StringIO())
+
+        self.assertEqual(set(OutgoingEmail.objects.values_list('status', 'attempts')), {('failed', 2)})
+        self.assertEqual(OutgoingEmail.objects.first().last_error, 'Connection refused')
+
+    def test_stale_claims_are_released(self):
+        OutgoingEmail.objects.update(
+            status='sending', attempts=1, claimed_at=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command('send_queued_emails', stdout=io.StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(set(OutgoingEmail.objects.values_list('status', 'attempts')), {('sent', 2)})
+
+
+class QueryPlanTests(TestCase):
+    def test_hot_queries_use_their_indexes(self):
+        seed_survey(get_staff_user(), 20, rng=random.Random(7))
+        OutgoingEmail.objects.create(to_email='rater@example.com', subject='Survey', body='Please respond')
+
+        # Raises CommandError, listing the plans, if any query stops using its index
+        call_command('explain_queries', stdout=io.StringIO())
@@ -27,4 +27,5 @@ urlpatterns = [
     # API endpoints
     path('api/survey/<str:token>/submit/', views.api_submit_survey, name='api_submit'),
     path('api/admin/generate-report/<int:survey_id>/', views.api_generate_report, name='api_generate_report'),
+    path('api/admin/dashboard-stats/', views.api_dashboard_stats, name='api_dashboard_stats'),
 ]
\ No newline at end of file
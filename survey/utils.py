@@ -1,6 +1,6 @@
 """Utility functions for the survey application."""
 
-from django.core.mail import send_mail
+from django.core.mail import send_mail, EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 import secrets
 import string
 
+from .models import OutgoingEmail, SurveyResponse
+
 
 def generate_secure_token(length=64):
     """Generate a cryptographically secure random token."""
@@ -16,8 +18,8 @@ def generate_secure_token(length=64):
     return ''.join(secrets.choice(alphabet) for _ in range(length))
 
 
-def send_survey_invitation(invitation, request=None):
-    """Send survey invitation email to participant."""
+def render_survey_invitation(invitation, request=None):
+    """Render the invitation email and return (subject, plain_message, html_message)."""
     survey = invitation.survey
     
     # Build the survey URL
@@ -39,11 +41,18 @@ def send_survey_invitation(invitation, request=None):
     # Render email templates
     html_message = render_to_string('emails/invitation.html', context)
     plain_message = strip_tags(html_message)
+    subject = f'Leadership Assessment Survey for {survey.leader_name}'
+    return subject, plain_message, html_message
+
+
+def send_survey_invitation(invitation, request=None):
+    """Send survey invitation email to participant."""
+    subject, plain_message, html_message = render_survey_invitation(invitation, request)
     
     # Send email
     try:
         send_mail(
-            subject=f'Leadership Assessment Survey for {survey.leader_name}',
+            subject=subject,
             message=plain_message,
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[invitation.email],
@@ -56,6 +65,35 @@ def send_survey_invitation(invitation, request=None):
         return False
 
 
+def queue_survey_invitations(invitations, request=None):
+    """Queue invitation emails for a batch of invitations with a single INSERT."""
+    outgoing_emails = []
+    for invitation in invitations:
+        subject, plain_message, html_message = render_survey_invitation(invitation, request)
+        outgoing_emails.append(OutgoingEmail(
+            invitation=invitation,
+            to_email=invitation.email,
+            subject=subject,
+            body=plain_message,
+            html_body=html_message,
+        ))
+    return OutgoingEmail.objects.bulk_create(outgoing_emails)
+
+
+def build_email_message(outgoing_email, connection=None):
+    """Build the EmailMultiAlternatives for a queued OutgoingEmail."""
+    message = EmailMultiAlternatives(
+        subject=outgoing_email.subject,
+        body=outgoing_email.body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[outgoing_email.to_email],
+        connection=connection,
+    )
+    if outgoing_email.html_body:
+        message.attach_alternative(outgoing_email.html_body, 'text/html')
+    return message
+
+
 def send_leader_self_assessment_email(survey, request=None):
     """Send self-assessment invitation to the leader."""
     from django.urls import reverse
@@ -140,18 +178,42 @@ def send_report_to_leader(report, request=None):
         return False
 
 
+LIKERT_SCORES = {
+    'significantly_above': 7,
+    'above': 6,
+    'slightly_above': 5,
+    'meets': 4,
+    'slightly_below': 3,
+    'below': 2,
+    'significantly_below': 1,
+}
+
+
 def calculate_likert_score(value):
-    """Convert Likert scale response to numeric score."""
-    scores = {
-        'significantly_above': 7,
-        'above': 6,
-        'slightly_above': 5,
-        'meets': 4,
-        'slightly_below': 3,
-        'below': 2,
-        'significantly_below': 1,
-    }
-    return scores.get(value, 4)
+    """Convert a Likert answer to its numeric score.
+
+    Accepts the stored 1-7 score (int or digit string) as well as the legacy
+    string keys ('above', 'meets', ...) still sent by older API clients.
+    Raises ValueError for anything else, including scores outside 1-7.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f'Invalid Likert answer: {value!r}')
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if isinstance(value, int):
+        if value not in dict(SurveyResponse.LIKERT_CHOICES):
+            raise ValueError(f'Likert answer out of range 1-7: {value!r}')
+        return value
+    if isinstance(value, str) and value in LIKERT_SCORES:
+        return LIKERT_SCORES[value]
+    raise ValueError(f'Invalid Likert answer: {value!r}')
+
+
+def parse_likert_answer(value):
+    """Convert a submitted Likert answer to the stored score, or None when left blank."""
+    if value in (None, ''):
+        return None
+    return calculate_likert_score(value)
 
 
 def get_question_texts():
@@ -4,23 +4,38 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponseForbidden
+from django.core.paginator import Paginator
+from django.http import JsonResponse, HttpResponseForbidden, HttpResponseNotAllowed, Http404
 from django.urls import reverse
 from django.utils import timezone
-from django.db.models import Count, Avg, Q
-from django.views.decorators.csrf import csrf_exempt
+from django.db.models import Count, Avg, Q, OuterRef, Subquery
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
 import json
 
-from .models import Survey, SurveyInvitation, SurveyResponse, StrengthRanking, OpportunityRanking, SurveyReport
+from asgiref.sync import sync_to_async
+
+from .models import (
+    Survey, SurveyInvitation, SurveyResponse, SurveyReport, OutgoingEmail, StrengthRanking, OpportunityRanking
+)
+from .dashboard import get_dashboard_stats
 from .forms import AdminLoginForm, CreateSurveyForm, InvitationForm, SurveyResponseForm, LeaderSelfAssessmentForm
+from .reports import aget_report_context, refresh_report_snapshot
+from .pagination import keyset_page
+from .services import (
+    collect_rankings, resolve_ranking_key, submit_survey_response, create_invitations, InvitationAlreadyUsed,
+    STRENGTH_KEYS, OPPORTUNITY_KEYS
+)
 from .utils import (
-    send_survey_invitation, send_report_to_leader, send_leader_self_assessment_email,
-    calculate_likert_score, get_question_texts, get_strength_choices, get_opportunity_choices
+    send_report_to_leader, send_leader_self_assessment_email,
+    parse_likert_answer
 )
 
 
+SURVEY_LIST_PAGE_SIZE = 25
+DETAIL_PAGE_SIZE = 25
+
+
 # Admin Views
 def admin_login_view(request):
     """Custom admin login view."""
@@ -51,10 +66,8 @@ def admin_dashboard_view(request):
     if not request.user.is_staff:
         return HttpResponseForbidden()
     
-    # Get statistics
-    total_surveys = Survey.objects.count()
-    active_surveys = Survey.objects.filter(is_active=True).count()
-    completed_surveys = Survey.objects.filter(leader_completed_self=True).count()
+    # Get statistics (cached; invalidated when surveys or responses change)
+    stats = get_dashboard_stats()
     
     # Get recent surveys
     recent_surveys = Survey.objects.all()[:5]
@@ -63,9 +76,11 @@ def admin_dashboard_view(request):
     pending_self_assessment = Survey.objects.filter(leader_completed_self=False)[:5]
     
     context = {
-        'total_surveys': total_surveys,
-        'active_surveys': active_surveys,
-        'completed_surveys': completed_surveys,
+        'total_surveys': stats['total_surveys'],
+        'active_surveys': stats['active_surveys'],
+        'completed_surveys': stats['completed_surveys'],
+        'pending_self_count': stats['pending_self_assessments'],
+        'responses_today': stats['responses_today'],
         'recent_surveys': recent_surveys,
         'pending_self_assessment': pending_self_assessment,
     }
@@ -79,7 +94,7 @@ def survey_list_view(request):
     if not request.user.is_staff:
         return HttpResponseForbidden()
     
-    surveys = Survey.objects.all().prefetch_related('responses', 'invitations')
+    surveys = Survey.objects.all()
     
     # Apply filters
     status_filter = request.GET.get('status')
@@ -90,9 +105,22 @@ def survey_list_view(request):
     elif status_filter == 'pending':
         surveys = surveys.filter(leader_completed_self=False)
     
+    search = request.GET.get('search', '').strip()
+    if search:
+        # Served by the trigram indexes from migration 0016 on PostgreSQL; SQLite scans the table
+        surveys = surveys.filter(
+            Q(leader_name__icontains=search) | Q(leader_email__icontains=search) | Q(title__icontains=search)
+        )
+    
+    cursor = request.GET.get('after')
+    surveys, next_cursor = keyset_page(surveys, cursor, SURVEY_LIST_PAGE_SIZE)
+    
     context = {
         'surveys': surveys,
         'status_filter': status_filter,
+        'search': search,
+        'is_first_page': not cursor,
+        'next_cursor': next_cursor,
     }
     
     return render(request, 'admin/survey_list.html', context)
@@ -130,21 +158,30 @@ def survey_detail_view(request, survey_id):
     if not request.user.is_staff:
         return HttpResponseForbidden()
     
-    survey = get_object_or_404(Survey, id=survey_id)
+    survey = get_object_or_404(Survey.objects.select_related('report'), id=survey_id)
     
-    # Get all responses
-    responses = survey.responses.all()
-    invitations = survey.invitations.all()
-    
-    # Calculate statistics
-    stats = {
-        'total_invitations': invitations.count(),
-        'completed_invitations': invitations.filter(used=True).count(),
-        'pending_invitations': invitations.filter(used=False, expires_at__gt=timezone.now()).count(),
-        'expired_invitations': invitations.filter(used=False, expires_at__lte=timezone.now()).count(),
-        'total_responses': responses.count(),
-        'self_assessment_complete': survey.leader_completed_self,
-    }
+    # Invitation statistics in one conditional aggregation
+    now = timezone.now()
+    stats = survey.invitations.aggregate(
+        total_invitations=Count('id'),
+        completed_invitations=Count('id', filter=Q(used=True)),
+        pending_invitations=Count('id', filter=Q(used=False, expires_at__gt=now)),
+        expired_invitations=Count('id', filter=Q(used=False, expires_at__lte=now)),
+    )
+    stats['total_responses'] = survey.response_count
+    stats['self_assessment_complete'] = survey.leader_completed_self
+    
+    # Paginate the tables; responses only need the columns the table shows.
+    # Totals are already known from the stats, so the paginators skip their COUNT queries.
+    response_paginator = Paginator(
+        survey.responses.only('id', 'survey', 'relationship', 'is_leader_self_assessment', 'submitted_at'),
+        DETAIL_PAGE_SIZE,
+    )
+    response_paginator.count = stats['total_responses']
+    invitation_paginator = Paginator(survey.invitations.all(), DETAIL_PAGE_SIZE)
+    invitation_paginator.count = stats['total_invitations']
+    responses = response_paginator.get_page(request.GET.get('responses_page'))
+    invitations = invitation_paginator.get_page(request.GET.get('invitations_page'))
     
     # Check if report exists
     try:
@@ -188,35 +225,17 @@ def leader_self_assessment_view(request, token):
             response.survey = survey
             response.relationship = 'self'
             response.is_leader_self_assessment = True
-            response.save()
-            
-            # Save rankings
-            strengths = form.cleaned_data['strengths']
-            opportunities = form.cleaned_data['opportunities']
-            
-            # Process strength rankings from POST data
-            for i, strength_id in enumerate(strengths):
-                rank = request.POST.get(f'strength_rank_{strength_id}', 5-i)
-                strength_text = get_strength_choices()[int(strength_id)]
-                StrengthRanking.objects.create(
-                    response=response,
-                    strength=strength_text,
-                    rank=int(rank)
-                )
             
-            # Process opportunity rankings from POST data
-            for i, opp_id in enumerate(opportunities):
-                rank = request.POST.get(f'opportunity_rank_{opp_id}', 5-i)
-                opp_text = get_opportunity_choices()[int(opp_id)]
-                OpportunityRanking.objects.create(
-                    response=response,
-                    opportunity=opp_text,
-                    rank=int(rank)
-                )
+            # Rankings come from the selected choices plus their posted ranks
+            strengths = collect_rankings(
+                form.cleaned_data['strengths'], STRENGTH_KEYS, request.POST, 'strength'
+            )
+            opportunities = collect_rankings(
+                form.cleaned_data['opportunities'], OPPORTUNITY_KEYS, request.POST, 'opportunity'
+            )
             
-            # Mark survey as self-assessment complete
-            survey.leader_completed_self = True
-            survey.save()
+            # Saves the response and rankings, and marks the self-assessment complete
+            submit_survey_response(response, strengths, opportunities)
             
             messages.success(request, 'Self-assessment completed successfully!')
             return redirect('leader_dashboard', token=token)
@@ -234,9 +253,12 @@ def leader_self_assessment_view(request, token):
     return render(request, template_name, context)
 
 
-def leader_dashboard_view(request, token):
+async def leader_dashboard_view(request, token):
     """Leader dashboard after completing self-assessment."""
-    survey = get_object_or_404(Survey, leader_token=token)
+    try:
+        survey = await Survey.objects.aget(leader_token=token)
+    except Survey.DoesNotExist:
+        raise Http404('No Survey matches the given query.')
     
     if not survey.leader_completed_self:
         return redirect('leader_self_assessment', token=token)
@@ -247,41 +269,26 @@ def leader_dashboard_view(request, token):
             emails = form.cleaned_data['emails']
             expires_at = form.cleaned_data['expires_at']
             
-            created_count = 0
-            failed_emails = []
-            
-            for email in emails:
-                # Check if invitation already exists
-                if not SurveyInvitation.objects.filter(survey=survey, email=email).exists():
-                    invitation = SurveyInvitation.objects.create(
-                        survey=survey,
-                        email=email,
-                        expires_at=expires_at
-                    )
-                    # Send invitation email
-                    try:
-                        if send_survey_invitation(invitation, request):
-                            created_count += 1
-                            print(f"✅ Email sent successfully to: {email}")
-                        else:
-                            failed_emails.append(email)
-                            print(f"❌ Failed to send email to: {email}")
-                    except Exception as e:
-                        failed_emails.append(email)
-                        print(f"❌ Exception sending email to {email}: {e}")
-                else:
-                    print(f"⚠️ Invitation already exists for: {email}")
+            # Delivery happens in the send_queued_emails worker; the inserts share one transaction
+            invitations = await sync_to_async(create_invitations)(survey, emails, expires_at, request)
+            created_count = len(invitations)
             
             if created_count > 0:
-                messages.success(request, f'Successfully sent {created_count} invitations.')
-            if failed_emails:
-                messages.warning(request, f'Failed to send emails to: {", ".join(failed_emails)}')
+                messages.success(request, f'Successfully queued {created_count} invitations for delivery.')
             
             return redirect('leader_dashboard', token=token)
     else:
         form = InvitationForm()
     
-    invitations = survey.invitations.all()
+    # One page of invitations; the survey's counter stands in for the paginator's COUNT query
+    latest_email = OutgoingEmail.objects.filter(invitation=OuterRef('pk')).order_by('-created_at')
+    invitation_paginator = Paginator(
+        survey.invitations.annotate(delivery_status=Subquery(latest_email.values('status')[:1])),
+        DETAIL_PAGE_SIZE,
+    )
+    invitation_paginator.count = survey.invitation_count
+    invitations = invitation_paginator.get_page(request.GET.get('page'))
+    invitations.object_list = [invitation async for invitation in invitations.object_list]
     
     context = {
         'survey': survey,
@@ -320,36 +327,26 @@ def participant_survey_view(request, token):
             response = form.save(commit=False)
             response.survey = survey
             response.invitation = invitation
-            response.save()
             
-            # Save rankings
-            strengths = form.cleaned_data['strengths']
-            opportunities = form.cleaned_data['opportunities']
-            
-            # Process strength rankings
-            for i, strength_id in enumerate(strengths):
-                rank = request.POST.get(f'strength_rank_{strength_id}', 5-i)
-                strength_text = get_strength_choices()[int(strength_id)]
-                StrengthRanking.objects.create(
-                    response=response,
-                    strength=strength_text,
-                    rank=int(rank)
-                )
-            
-            # Process opportunity rankings
-            for i, opp_id in enumerate(opportunities):
-                rank = request.POST.get(f'opportunity_rank_{opp_id}', 5-i)
-                opp_text = get_opportunity_choices()[int(opp_id)]
-                OpportunityRanking.objects.create(
-                    response=response,
-                    opportunity=opp_text,
-                    rank=int(rank)
-                )
+            # Rankings come from the selected choices plus their posted ranks
+            strengths = collect_rankings(
+                form.cleaned_data['strengths'], STRENGTH_KEYS, request.POST, 'strength'
+            )
+            opportunities = collect_rankings(
+                form.cleaned_data['opportunities'], OPPORTUNITY_KEYS, request.POST, 'opportunity'
+            )
             
-            # Mark invitation as used
-            invitation.used = True
-            invitation.used_at = timezone.now()
-            invitation.save()
+            # Saves the response and rankings, and marks the invitation as used
+            try:
+                submit_survey_response(response, strengths, opportunities, invitation=invitation)
+            except InvitationAlreadyUsed:
+                # A concurrent submission used the link after it was checked above
+                invitation.used = True
+                context = {
+                    'invitation': invitation,
+                    'admin_email': settings.DEFAULT_FROM_EMAIL.split('<')[-1].rstrip('>') if '<' in settings.DEFAULT_FROM_EMAIL else settings.DEFAULT_FROM_EMAIL
+                }
+                return render(request, 'survey/invalid_link.html', context)
             
             messages.success(request, 'Thank you for completing the survey!')
             # Use redirect to prevent form resubmission
@@ -400,128 +397,26 @@ def generate_report_view(request, survey_id):
     if not created:
         report.generated_at = timezone.now()
         report.generated_by = request.user
-        report.save()
+        report.save(update_fields=['generated_at', 'generated_by'])
+    
+    refresh_report_snapshot(report)
     
     messages.success(request, 'Report generated successfully!')
     return redirect('view_report', report_token=report.report_token)
 
 
-def view_report(request, report_token):
+async def view_report(request, report_token):
     """View survey report."""
-    report = get_object_or_404(SurveyReport, report_token=report_token)
+    try:
+        report = await SurveyReport.objects.select_related('survey').aget(report_token=report_token)
+    except SurveyReport.DoesNotExist:
+        raise Http404('No SurveyReport matches the given query.')
     survey = report.survey
     
-    # Get all responses
-    responses = survey.responses.all()
-    
-    # Calculate statistics for each question
-    question_stats = {}
-    question_texts = get_question_texts()
-    
-    for q_num in range(2, 56):
-        field_name = f'q{q_num}_response'
-        scores = []
-        scores_by_relationship = {
-            'self': [],
-            'supervisor': [],
-            'peer': [],
-            'teacher': [],
-            'student': [],
-            'parent': []
-        }
-        
-        for response in responses:
-            value = getattr(response, field_name)
-            if value:  # Only include non-empty responses
-                score = calculate_likert_score(value)
-                scores.append(score)
-                
-                # Group by relationship type
-                relationship = 'self' if response.is_leader_self_assessment else response.relationship
-                if relationship in scores_by_relationship:
-                    scores_by_relationship[relationship].append(score)
-        
-        if scores:
-            # Calculate averages by relationship
-            avg_by_relationship = {}
-            for rel, rel_scores in scores_by_relationship.items():
-                avg_by_relationship[rel] = round(sum(rel_scores) / len(rel_scores), 2) if rel_scores else None
-            
-            question_stats[q_num] = {
-                'text': question_texts[q_num],
-                'average': round(sum(scores) / len(scores), 2),
-                'scores': scores,
-                'response_count': len(scores),
-                'by_relationship': avg_by_relationship,
-            }
-    
-    # Get top strengths and opportunities
-    all_strengths = {}
-    all_opportunities = {}
-    
-    for response in responses:
-        for strength in response.strength_rankings.all():
-            if strength.strength not in all_strengths:
-                all_strengths[strength.strength] = []
-            all_strengths[strength.strength].append(strength.rank)
-        
-        for opportunity in response.opportunity_rankings.all():
-            if opportunity.opportunity not in all_opportunities:
-                all_opportunities[opportunity.opportunity] = []
-            all_opportunities[opportunity.opportunity].append(opportunity.rank)
-    
-    # Calculate average rankings
-    top_strengths = []
-    for strength, ranks in all_strengths.items():
-        avg_rank = sum(ranks) / len(ranks)
-        top_strengths.append((strength, avg_rank, len(ranks)))
-    top_strengths.sort(key=lambda x: x[1], reverse=True)
-    
-    top_opportunities = []
-    for opportunity, ranks in all_opportunities.items():
-        avg_rank = sum(ranks) / len(ranks)
-        top_opportunities.append((opportunity, avg_rank, len(ranks)))
-    top_opportunities.sort(key=lambda x: x[1], reverse=True)
-    
-    # Get open-ended responses
-    continue_responses = [r.continue_doing for r in responses if r.continue_doing]
-    stop_responses = [r.stop_doing for r in responses if r.stop_doing]
-    start_responses = [r.start_doing for r in responses if r.start_doing]
-    
-    # Calculate overall statistics
-    total_responses = responses.count()
-    participant_responses = responses.exclude(is_leader_self_assessment=True).count()
-    
-    # Calculate participant counts by relationship type
-    supervisors_count = responses.filter(relationship='supervisor').count()
-    peers_count = responses.filter(relationship='peer').count()
-    staff_count = responses.filter(relationship='teacher').count()
-    students_count = responses.filter(relationship='student').count()
-    community_count = responses.filter(relationship='parent').count()
-    
-    # Calculate overall average score
-    all_scores = []
-    for stats in question_stats.values():
-        all_scores.extend(stats['scores'])
-    overall_average = round(sum(all_scores) / len(all_scores), 2) if all_scores else 0
-    
     context = {
         'report': report,
         'survey': survey,
-        'response_count': total_responses,
-        'participant_count': participant_responses,
-        'overall_average': overall_average,
-        'question_stats': question_stats,
-        'top_strengths': top_strengths[:10],
-        'top_opportunities': top_opportunities[:10],
-        'continue_responses': continue_responses,
-        'stop_responses': stop_responses,
-        'start_responses': start_responses,
-        'supervisors_count': supervisors_count,
-        'peers_count': peers_count,
-        'staff_count': staff_count,
-        'students_count': students_count,
-        'community_count': community_count,
+        **await aget_report_context(report),
     }
     
     return render(request, 'reports/web_report.html', context)
@@ -548,16 +443,21 @@ def send_report_view(request, survey_id):
 
 
 # API Endpoints
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_submit_survey(request, token):
+async def api_submit_survey(request, token):
     """API endpoint for survey submission."""
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
     try:
         data = json.loads(request.body)
         
         # Determine if it's a leader or participant survey
         if 'invitation_token' in data:
-            invitation = get_object_or_404(SurveyInvitation, token=data['invitation_token'])
+            try:
+                invitation = await SurveyInvitation.objects.select_related('survey').aget(
+                    token=data['invitation_token']
+                )
+            except SurveyInvitation.DoesNotExist:
+                raise Http404('No SurveyInvitation matches the given query.')
             survey = invitation.survey
             
             if invitation.used:
@@ -565,54 +465,63 @@ def api_submit_survey(request, token):
             if invitation.is_expired:
                 return JsonResponse({'error': 'Survey link expired'}, status=400)
         else:
-            survey = get_object_or_404(Survey, leader_token=token)
+            try:
+                survey = await Survey.objects.aget(leader_token=token)
+            except Survey.DoesNotExist:
+                raise Http404('No Survey matches the given query.')
             invitation = None
             
             if survey.leader_completed_self:
                 return JsonResponse({'error': 'Self-assessment already completed'}, status=400)
         
-        # Create response
-        response = SurveyResponse.objects.create(
+        # Build response
+        response = SurveyResponse(
             survey=survey,
             invitation=invitation,
             relationship=data.get('relationship'),
             is_leader_self_assessment=(invitation is None),
-            **{f'q{i}_response': data.get(f'q{i}') for i in range(2, 56)},
+            **{f'q{i}_response': parse_likert_answer(data.get(f'q{i}')) for i in range(2, 56)},
             continue_doing=data.get('continue_doing', ''),
             stop_doing=data.get('stop_doing', ''),
             start_doing=data.get('start_doing', '')
         )
+        # Rankings are identified by choice key; the display text is still accepted
+        strengths = [
+            (resolve_ranking_key(StrengthRanking.STRENGTH_CHOICES, item.get('key', item.get('text'))), item['rank'])
+            for item in data.get('strengths', [])
+        ]
+        opportunities = [
+            (resolve_ranking_key(OpportunityRanking.OPPORTUNITY_CHOICES, item.get('key', item.get('text'))), item['rank'])
+            for item in data.get('opportunities', [])
+        ]
         
-        # Save rankings
-        for strength_data in data.get('strengths', []):
-            StrengthRanking.objects.create(
-                response=response,
-                strength=strength_data['text'],
-                rank=strength_data['rank']
-            )
-        
-        for opp_data in data.get('opportunities', []):
-            OpportunityRanking.objects.create(
-                response=response,
-                opportunity=opp_data['text'],
-                rank=opp_data['rank']
-            )
-        
-        # Update invitation/survey status
-        if invitation:
-            invitation.used = True
-            invitation.used_at = timezone.now()
-            invitation.save()
-        else:
-            survey.leader_completed_self = True
-            survey.save()
+        # Saves the response and rankings, and updates invitation/survey status in one transaction
+        await sync_to_async(submit_survey_response)(response, strengths, opportunities, invitation=invitation)
         
         return JsonResponse({'success': True, 'message': 'Survey submitted successfully'})
     
+    except InvitationAlreadyUsed as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+# csrf_exempt and require_http_methods only wrap sync views before Django 5.0
+api_submit_survey.csrf_exempt = True
+
+
+@login_required
+@require_http_methods(["GET"])
+def api_dashboard_stats(request):
+    """API endpoint returning the cached dashboard totals for polling."""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    return JsonResponse(get_dashboard_stats())
+
+
 @login_required
 @require_http_methods(["POST"])
 def api_generate_report(request, survey_id):
@@ -630,7 +539,9 @@ def api_generate_report(request, survey_id):
     if not created:
         report.generated_at = timezone.now()
         report.generated_by = request.user
-        report.save()
+        report.save(update_fields=['generated_at', 'generated_by'])
+    
+    refresh_report_snapshot(report)
     
     report_url = request.build_absolute_uri(
         reverse('view_report', kwargs={'report_token': report.report_token})